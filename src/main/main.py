@@ -1,18 +1,19 @@
-import os
 from pathlib import Path
+from datetime import datetime
 import json
 from dotenv import load_dotenv
 
-from src.scrapers.rss_feeds_worldnews import RssWorldFeed
-from src.scrapers.tech_news import RssTechFeed
-from src.scrapers.sports_news import RssSportsFeed
-from src.scrapers.science_news import RssScienceFeed
-from src.scrapers.entertainment_rss import RssEntertainmentFeed
-from src.scrapers.finance_crypto import MoneyInfo, RssFinanceFeed
-from src.scrapers.morning_weather import capture_weather_screenshot
+from src.scrapers.feed_registry import enabled_feeds, read_feeds, select_news
+from src.scrapers.finance_crypto import MoneyInfo, pair_label, resolve_money_config, select_crypto
+from src.scrapers.morning_weather import capture_weather_screenshots, content_id_for, get_cities
 
-from src.templates.email_template import build_email_html
+from src.templates.email_template import build_email_html, FINANCE_NEWS_LIMIT, NEWS_SECTION_LIMIT
 from src.services.email_service import EmailService
+from src.utils.scheduler import run_concurrently
+from src.utils.feed_fetcher import run_feed_tasks, clear_run_memo
+from src.utils.profiles import load_profiles, union_config
+from src.utils.dedup import dedupe_sections
+from src.utils.story_history import StoryHistory
 
 # Load environment variables
 load_dotenv()
@@ -23,80 +24,148 @@ with open(config_path, 'r', encoding='utf-8') as f:
     config_data = json.load(f)
 
 
-def collect_all_data():
-    """Collect data from all sources"""
+def _capture_weather(config) -> dict:
+    """Capture the radar for every configured city
+    Returns: Dict of {city: image_path}
+    """
+    # headless=True ensures a browser fallback runs in background
+    return capture_weather_screenshots(get_cities(config.get('weather', {})), headless=True)
+
+
+# Registry category -> build_email_html argument
+FEED_CATEGORIES = {
+    'world': 'web_scrapper',
+    'tech': 'tech_news',
+    'sports': 'sports_news',
+    'science': 'science_news',
+    'entertainment': 'entertainment_news',
+    'finance': 'finance_news',
+}
+
+
+def _feed_depth(config) -> int:
+    """How many times deeper than its limit each feed is read, to backfill already-sent stories"""
+    history_config = config.get('history', {})
+    return max(1, history_config.get('backfill', 3)) if history_config.get('enabled') else 1
+
+
+def _collect_feeds(config) -> dict:
+    """Read every enabled feed once, in one batch on a single event loop
+    Returns: Dict of {Feed: List of (source, title, link)}, read backfill-deep
+    """
+    return run_feed_tasks(read_feeds(enabled_feeds(config), _feed_depth(config)),
+                          **config.get('feeds', {}).get('session', {}))[0]
+
+
+def _news_sections(feed_results, config, keep=None) -> dict:
+    """One config's news sections, sliced in memory from the shared feed results"""
+    news = select_news(feed_results, config, keep)
+    return {data_key: news.get(category, []) for category, data_key in FEED_CATEGORIES.items()}
+
+
+# News sections in the order the email renders them; when a story shows up
+# in several, the first section keeps it
+RENDER_ORDER = ['finance_news', 'web_scrapper', 'tech_news', 'sports_news',
+                'science_news', 'entertainment_news']
+
+
+def _dedupe_news(data, config) -> dict:
+    """Collapse stories repeated across sources and sections before rendering"""
+    dedup_config = config.get('dedup', {})
+    if not dedup_config.get('enabled', True):
+        return data
+    return dedupe_sections(data, RENDER_ORDER, threshold=dedup_config.get('threshold', 0.5))
+
+
+def _money_sections(shared, config) -> dict:
+    """Pick the finance sections a config asks for, out of the shared money data
+
+    Coins and currency pairs are narrowed to the subscriber's own lists; the
+    pairs are recomputed from the USD table the shared MoneyInfo already
+    loaded, so this needs no network.
+    """
+    money_data = shared.get('money', {})
+    money_config = resolve_money_config(config.get('money', {}))
+
+    exchange_rates = None
+    if money_config.get('exchange'):
+        money_info = shared.get('money_info')
+        exchange_rates = money_info.cross_rates(money_config['exchange_pairs']) if money_info else {}
+        if not exchange_rates:
+            # no table this run (provider down): use the rates that were served
+            labels = [pair_label(pair) for pair in money_config['exchange_pairs']]
+            served = money_data.get('exchange_rates') or {}
+            exchange_rates = {label: served[label] for label in labels if label in served}
+
+    # sections served from an older snapshot get an "as of" label
+    stale = shared['money_info'].stale if shared.get('money_info') else {}
+    money_as_of = {section: datetime.fromtimestamp(stale[key])
+                   for key, section in [('crypto', 'crypto_data'), ('exchange_rates', 'exchange_rates')]
+                   if key in stale}
+
+    return {
+        'crypto_data': select_crypto(money_data.get('crypto') or {}, money_config)
+        if money_config.get('crypto') else None,
+        'exchange_rates': exchange_rates,
+        'money_as_of': money_as_of,
+    }
+
+
+def collect_all_data(config=None):
+    """Collect data from all sources concurrently"""
+    config = config_data if config is None else config
+
     print("\n" + "=" * 60)
     print("COLLECTING DATA...")
     print("=" * 60)
 
-    data = {}
-
-    # World News
-    print("\nWorld news...")
-    world_feed = RssWorldFeed(config_data)
-    data['web_scrapper'] = world_feed.get_news()
-    print(f"   Collected {len(data['web_scrapper'])} world news items")
-
-    # Tech News
-    print("\nTech news...")
-    tech_feed = RssTechFeed(config_data)
-    data['tech_news'] = tech_feed.get_news()
-    print(f"   Collected {len(data['tech_news'])} tech news items")
-
-    # Sports
-    print("\nSports...")
-    sports_feed = RssSportsFeed(config_data)
-    data['sports_news'] = sports_feed.get_news()
-    print(f"   Collected {len(data['sports_news'])} sports news items")
-
-    # Science
-    print("\nScience...")
-    science_feed = RssScienceFeed(config_data)
-    data['science_news'] = science_feed.get_news()
-    print(f"   Collected {len(data['science_news'])} science news items")
-
-    # Entertainment
-    print("\nEntertainment...")
-    ent_feed = RssEntertainmentFeed(config_data)
-    data['entertainment_news'] = ent_feed.get_news()
-    print(f"   Collected {len(data['entertainment_news'])} entertainment news items")
+    scheduler_config = config.get('scheduler', {})
+
+    # Every source is independent, so they all run at once on a bounded pool.
+    # The RSS categories share one event loop and one pooled HTTP session.
+    money_info = MoneyInfo(config)
+    jobs = {
+        'feeds': lambda: _collect_feeds(config),
+        'money': money_info.get_money,
+        'weather': lambda: _capture_weather(config),
+    }
+
+    print("\nFetching all sources...")
+    results = run_concurrently(
+        jobs,
+        max_workers=scheduler_config.get('max_workers', 8),
+        timeout=scheduler_config.get('timeout', 60),
+        timeouts=scheduler_config.get('timeouts', {}),
+        defaults={'feeds': {}, 'money': {}, 'weather': {}},
+    )
+
+    data = {'feed_results': results.get('feeds') or {}}
+    data.update(_news_sections(data['feed_results'], config))
+
+    for key, label in [('web_scrapper', 'world'), ('tech_news', 'tech'),
+                       ('sports_news', 'sports'), ('science_news', 'science'),
+                       ('entertainment_news', 'entertainment'), ('finance_news', 'finance')]:
+        print(f"   Collected {len(data[key])} {label} news items")
 
     # Finance
-    print("\nFinance...")
-    money = MoneyInfo(config_data)
-    money_data = money.get_money()
-
-    data['crypto_data'] = money_data.get('crypto')
-    data['exchange_rates'] = money_data.get('exchange_rates')
+    data['money'] = results.get('money') or {}
+    data['money_info'] = money_info
+    data.update(_money_sections(data, config))
 
     if data['crypto_data']:
         print(f"   Collected crypto data: {list(data['crypto_data'].keys())}")
     if data['exchange_rates']:
         print(f"   Collected {len(data['exchange_rates'])} exchange rates")
 
-    finance_feed = RssFinanceFeed(config_data)
-    data['finance_news'] = finance_feed.get_news()
-    print(f"   Collected {len(data['finance_news'])} finance news items")
-
-    # Weather Screenshot
-    print("\nCapturing weather screenshot...")
-    screenshot_path = Path(__file__).parent.parent / 'imgs' / 'morning_weather.png'
-
-    try:
-        # headless=True ensures it runs in background
-        print("   Running browser automation...")
-        success = capture_weather_screenshot(headless=True)
-        
-        if success and screenshot_path.exists():
-            data['has_weather_screenshot'] = True
-            print(f"   Weather screenshot captured successfully")
-        else:
-            print(f"   Failed to capture weather screenshot")
-            data['has_weather_screenshot'] = False
-
-    except Exception as e:
-        print(f"   Weather screenshot check error: {e}")
-        data['has_weather_screenshot'] = False
+    # Weather Screenshots, one Content-ID per city
+    captured = results.get('weather') or {}
+    data['weather_images'] = [(city, content_id_for(city)) for city in captured]
+    data['weather_files'] = {content_id_for(city): str(path) for city, path in captured.items()}
+    data['has_weather_screenshot'] = bool(captured)
+    if captured:
+        print(f"   Weather screenshots captured: {', '.join(captured)}")
+    else:
+        print(f"   Failed to capture weather screenshot")
 
     print("\n" + "=" * 60)
     print("DATA COLLECTION COMPLETE!")
@@ -105,48 +174,118 @@ def collect_all_data():
     return data
 
 
+def build_subscriber_data(shared, config, keep=None) -> dict:
+    """Fan the shared collection out to one subscriber's config
+
+    News is sliced from the feeds the shared collection already read, in
+    memory: no event loop, no network I/O, and a feed the shared fetch
+    missed stays empty instead of being downloaded again. `keep` filters
+    out stories (e.g. already sent ones) before each feed is trimmed to
+    its limit.
+    """
+    data = _news_sections(shared.get('feed_results', {}), config, keep)
+    data.update(_money_sections(shared, config))
+
+    cities = get_cities(config.get('weather', {}))
+    data['weather_images'] = [(city, cid) for city, cid in shared.get('weather_images', [])
+                              if city in cities]
+    data['has_weather_screenshot'] = bool(data['weather_images'])
+    return data
+
+
+def _rendered_stories(data) -> list:
+    """The (source, title, link) items that actually make it into the email"""
+    stories = list((data.get('finance_news') or [])[:FINANCE_NEWS_LIMIT])
+    for key in RENDER_ORDER[1:]:
+        stories.extend((data.get(key) or [])[:NEWS_SECTION_LIMIT])
+    return stories
+
+
+def _email_fields(data) -> dict:
+    """Drop the collector-only keys before rendering"""
+    return {key: value for key, value in data.items() if key not in ('feed_results', 'money', 'money_info', 'weather_files')}
+
+
 def main():
     """Main function - collect data and send email"""
 
     print("\n" + "DAILY DIGEST AUTOMATION STARTED" + "\n")
 
     try:
+        email_service = EmailService()
+
+        # Every subscriber's sources are fetched once, as a union
+        profiles = load_profiles(config_data, email_service.recipient_emails)
+        shared_config = union_config([
+            dict(profile['config'], money=resolve_money_config(profile['config'].get('money', {})))
+            for profile in profiles
+        ])
+
         # Collect all data
-        data = collect_all_data()
+        clear_run_memo()
+        shared = collect_all_data(shared_config)
+        weather_files = shared.get('weather_files', {})
 
-        # Build HTML email
-        print("Building email HTML...")
-        html_content = build_email_html(**data)
-        print("   Email HTML built successfully\n")
+        # Stories already sent to a subscriber are skipped and backfilled
+        history_config = config_data.get('history', {})
+        history = StoryHistory(
+            retention_days=history_config.get('retention_days', 30),
+            max_rows=history_config.get('max_rows', 20000),
+        ) if history_config.get('enabled') else None
+
+        subject = f"Daily Digest - {datetime.now().strftime('%B %d, %Y')}"
 
-        # Prepare images to embed
-        images = {}
-        screenshot_path = Path(__file__).parent.parent / 'imgs' / 'morning_weather.png'
-        if screenshot_path.exists():
-            images['weather_map'] = str(screenshot_path)
-            print(f"   Weather screenshot will be embedded\n")
+        # Build one HTML email per subscriber
+        print(f"Building email HTML for {len(profiles)} subscriber(s)...")
+        messages = []
+        sent_stories = {}
+        for profile in profiles:
+            if len(profiles) == 1 and history is None:
+                data = shared
+            else:
+                keep = history.new_story_filter(profile['email']) if history else None
+                data = build_subscriber_data(shared, profile['config'], keep)
+            data = _dedupe_news(data, profile['config'])
+            sent_stories[profile['email']] = _rendered_stories(data)
+            html_content = build_email_html(**_email_fields(data))
+
+            # Prepare images to embed
+            images = {
+                cid: weather_files[cid] for _, cid in data.get('weather_images', [])
+                if cid in weather_files and Path(weather_files[cid]).exists()
+            }
+            messages.append({
+                'recipient': profile['email'],
+                'subject': subject,
+                'html_content': html_content,
+                'image_paths': images if images else None
+            })
+        print("   Email HTML built successfully\n")
 
         # Send email
         print("Sending email...")
-        email_service = EmailService()
 
-        from datetime import datetime
-        subject = f"Daily Digest - {datetime.now().strftime('%B %d, %Y')}"
-
-        success = email_service.send_email(
-            subject=subject,
-            html_content=html_content,
-            image_paths=images if images else None
+        # One SMTP session (or a small pool) for every recipient
+        report = email_service.send_batch(
+            messages,
+            pool_size=config_data.get('email', {}).get('smtp_connections', 1)
         )
+        delivered = [entry['recipient'] for entry in report if entry['success']]
+
+        if history:
+            for recipient in delivered:
+                history.mark_sent(recipient, sent_stories.get(recipient, []))
 
         print("\n" + "=" * 60)
-        if success:
+        if report and len(delivered) == len(report):
             print("EMAIL SENT SUCCESSFULLY!")
             print("=" * 60)
-            print(f"Check your inbox: {os.getenv('RECIPIENT_EMAIL')}")
+            print(f"Check your inbox: {', '.join(delivered)}")
         else:
-            print("FAILED TO SEND EMAIL")
+            print("FAILED TO SEND EMAIL" if not delivered else "SOME EMAILS FAILED")
             print("=" * 60)
+            if delivered:
+                print(f"Delivered to: {', '.join(delivered)}")
             print("Check your .env file and email configuration")
         print("=" * 60 + "\n")
 
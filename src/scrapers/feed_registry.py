@@ -0,0 +1,129 @@
+import json
+import asyncio
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+from src.utils.feed_fetcher import fetch_rss
+
+#load feed registry with proper path
+feeds_path = Path(__file__).parent.parent / 'configs' / 'feeds.json'
+
+
+class Feed(NamedTuple):
+    """One registry row: where a feed lives and which config flag enables it"""
+    category: str
+    section: str
+    key: str
+    source: str
+    url: str
+    limit: int = 3
+    # seconds a fetched copy stays fresh, None uses feeds.cache.ttl
+    ttl: int = None
+
+
+def load_feeds(path: Path = feeds_path) -> List[Feed]:
+    """Read the feed registry"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            rows = json.load(f).get('feeds', [])
+    except FileNotFoundError:
+        print(f'feeds.json not found at {path}')
+        rows = []
+    return [Feed(**row) for row in rows]
+
+
+# Loaded once at import and indexed by config key, by category and by position
+FEEDS: List[Feed] = load_feeds()
+FEEDS_BY_KEY: Dict[Tuple[str, str], List[Feed]] = {}
+FEEDS_BY_CATEGORY: Dict[str, List[Feed]] = {}
+FEED_POSITION: Dict[Feed, int] = {}
+for _position, _feed in enumerate(FEEDS):
+    FEEDS_BY_KEY.setdefault((_feed.section, _feed.key), []).append(_feed)
+    FEEDS_BY_CATEGORY.setdefault(_feed.category, []).append(_feed)
+    FEED_POSITION.setdefault(_feed, _position)
+
+
+def enabled_feeds(config: Dict, category: str = None) -> List[Feed]:
+    """Registry rows switched on in the config, in registry order
+    Only the flags that are on get looked up, through FEEDS_BY_KEY
+    """
+    feeds = [feed
+             for section, flags in config.items() if isinstance(flags, dict)
+             for key, enabled in flags.items() if enabled
+             for feed in FEEDS_BY_KEY.get((section, key), [])
+             if category is None or feed.category == category]
+    return sorted(feeds, key=FEED_POSITION.__getitem__)
+
+
+# Predicate over (source, title, link), e.g. "not sent to this subscriber yet"
+StoryFilter = Callable[[str, str, str], bool]
+
+
+async def read_feeds(feeds: List[Feed], depth: int = 1) -> Dict[Feed, List[Tuple[str, str, str]]]:
+    """Download every feed at once, each `depth` times its limit deep
+    Returns: Dict of {feed: List of (source, title, link)}, not trimmed to the limits
+    """
+    for feed in feeds:
+        print(f"Fetching {feed.source} RSS...")
+
+    results = await asyncio.gather(*(fetch_rss(feed.url, feed.source, feed.limit * depth, feed.ttl)
+                                     for feed in feeds))
+    return {feed: [(feed.source, title, link) for title, link in items]
+            for feed, items in zip(feeds, results)}
+
+
+def trim_feed(feed: Feed, items: List[Tuple[str, str, str]],
+              keep: StoryFilter = None) -> List[Tuple[str, str, str]]:
+    """The items of one feed that get shown: filtered by `keep`, cut to the feed's limit
+
+    Rejected items leave room for the ones further down (the backfill depth).
+    """
+    if keep is not None:
+        items = [item for item in items if keep(*item)]
+    return items[:feed.limit]
+
+
+async def fetch_feeds(feeds: List[Feed], depth: int = 1,
+                      keep: StoryFilter = None) -> List[List[Tuple[str, str, str]]]:
+    """Download every feed at once
+    Returns: One List of (source, title, link) per feed, in the same order
+    """
+    results = await read_feeds(feeds, depth)
+    return [trim_feed(feed, results[feed], keep) for feed in feeds]
+
+
+async def fetch_category(config: Dict, category: str, depth: int = 1,
+                         keep: StoryFilter = None) -> List[Tuple[str, str, str]]:
+    """Fetch all enabled feeds of one category
+    Returns: List of (source, title, link)
+    """
+    results = await fetch_feeds(enabled_feeds(config, category), depth, keep)
+    return [item for items in results for item in items]
+
+
+def select_news(results: Dict[Feed, List[Tuple[str, str, str]]], config: Dict,
+                keep: StoryFilter = None) -> Dict[str, List[Tuple[str, str, str]]]:
+    """Slice one config's news out of feeds already read by read_feeds, no I/O
+    Feeds missing from `results` (e.g. the fetch timed out) come out empty
+    Returns: Dict of {category: List of (source, title, link)}
+    """
+    news = {category: [] for category in FEEDS_BY_CATEGORY}
+    for feed in enabled_feeds(config):
+        news[feed.category].extend(trim_feed(feed, results.get(feed, []), keep))
+    return news
+
+
+class RegistryFeed:
+    """Base for the per-category feed classes, driven by the registry"""
+    category: str = None
+
+    def __init__(self, config_json):
+        self.config = config_json
+        self.news_list = []
+
+    async def get_news(self) -> List[Tuple[str, str, str]]:
+        """Fetch all enabled RSS news sources
+        Returns: List of (source, title, link)
+        """
+        self.news_list = await fetch_category(self.config, self.category)
+        return self.news_list
@@ -1,10 +1,15 @@
 # src/scrapers/finance_crypto.py
 import json
-import requests
-import feedparser
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
-from bs4 import BeautifulSoup
+from typing import Any, Callable, Dict, List, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+
+from src.utils import http_client
+from src.utils.scheduler import run_concurrently
+from src.utils.market_history import MarketHistory
+from src.scrapers.feed_registry import RegistryFeed
+from src.utils.feed_fetcher import run_feed_tasks, result_cache
 
 config_path = Path(__file__).parent.parent / 'configs' / 'config.json'
 
@@ -15,96 +20,311 @@ except FileNotFoundError:
     print(f'config.json not found at {config_path}')
     config_data = {}
 
+# Index name -> Yahoo symbol, override with money.stock_indices
+DEFAULT_INDICES = {
+    'S&P 500': '^GSPC',
+    'Dow Jones': '^DJI',
+    'Nasdaq': '^IXIC',
+    'FTSE 100': '^FTSE',
+}
+
+# CoinGecko ids tracked when money.crypto_watchlist has none
+DEFAULT_COINS = ['bitcoin', 'ethereum']
+# ids per simple/price request, keeps the URL a sane length
+COINGECKO_BATCH = 250
+
+# Pairs shown when money.exchange_pairs is empty
+DEFAULT_EXCHANGE_PAIRS = ['USD/EUR', 'USD/GBP', 'USD/JPY', 'USD/CNH',
+                          'USD/CAD', 'USD/CHF', 'USD/BRL', 'USD/RUB']
+
+# Metal -> Yahoo futures symbol (USD per troy ounce)
+METAL_SYMBOLS = {
+    'Gold (XAU)': 'GC=F',
+    'Silver (XAG)': 'SI=F',
+    'Platinum (XPT)': 'PL=F',
+}
+
+# JSON quote endpoint taking many symbols per request
+YAHOO_SPARK_URL = 'https://query1.finance.yahoo.com/v7/finance/spark'
+YAHOO_SPARK_BATCH = 20
+YAHOO_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+
+def _parse_spark(data: Dict) -> Dict[str, Tuple[float, float]]:
+    """Read (price, change) per symbol out of a spark response
+    Handles both the flat {symbol: {...}} and the older {"spark": {"result": [...]}} layouts
+    """
+    quotes = {}
+
+    if 'spark' in data:
+        for result in (data['spark'] or {}).get('result') or []:
+            for response in result.get('response') or []:
+                meta = response.get('meta', {})
+                price = meta.get('regularMarketPrice')
+                previous = meta.get('chartPreviousClose', meta.get('previousClose'))
+                if price is not None:
+                    quotes[result['symbol']] = (float(price), float(price - previous) if previous else 0.0)
+        return quotes
+
+    for symbol, series in data.items():
+        if not isinstance(series, dict):
+            continue
+        closes = [close for close in series.get('close') or [] if close is not None]
+        if not closes:
+            continue
+        previous = series.get('chartPreviousClose', series.get('previousClose'))
+        quotes[symbol] = (float(closes[-1]), float(closes[-1] - previous) if previous else 0.0)
+    return quotes
+
+
+def watchlist_coins(money_config: Dict) -> Dict[str, str]:
+    """Coins of money.crypto_watchlist as {CoinGecko id: display name}
+    The list form gets names from the ids ("usd-coin" -> "Usd Coin")
+    """
+    coins = money_config.get('crypto_watchlist', {}).get('coins') or DEFAULT_COINS
+    if isinstance(coins, list):
+        coins = {coin: None for coin in coins}
+    return {coin: name or coin.replace('-', ' ').title() for coin, name in coins.items()}
+
+
+def watchlist_currencies(money_config: Dict) -> List[str]:
+    """Quote currencies of money.crypto_watchlist, the first one is shown"""
+    currencies = money_config.get('crypto_watchlist', {}).get('vs_currencies') or ['usd']
+    return [currency.lower() for currency in currencies]
+
+
+def resolve_money_config(money_config: Dict) -> Dict:
+    """Copy of a money section with every list spelled out (watchlist, indices, pairs)
+
+    Lets union_config merge subscribers that rely on the defaults with the
+    ones that don't, so nobody's coins or pairs are left out of the fetch.
+    """
+    resolved = dict(money_config)
+    resolved['crypto_watchlist'] = {
+        'coins': watchlist_coins(money_config),
+        'vs_currencies': watchlist_currencies(money_config),
+    }
+    resolved['stock_indices'] = dict(money_config.get('stock_indices') or DEFAULT_INDICES)
+    resolved['exchange_pairs'] = list(money_config.get('exchange_pairs') or DEFAULT_EXCHANGE_PAIRS)
+    return resolved
+
+
+def _in_currency(entry: Dict, currency: str) -> Dict:
+    """A crypto entry with 'price' / 'change_24h' (and 'change_7d' / 'trend' when
+    the history has them) taken in `currency`
+    """
+    entry = dict(entry)
+    entry['currency'] = currency
+    entry['price'] = entry['prices'][currency]
+    entry['change_24h'] = entry.get('changes', {}).get(currency, 0)
+    for key, by_currency in (('change_7d', 'changes_7d'), ('trend', 'trends')):
+        if currency in entry.get(by_currency, {}):
+            entry[key] = entry[by_currency][currency]
+        else:
+            entry.pop(key, None)
+    return entry
+
+
+def select_crypto(crypto: Dict, money_config: Dict) -> Dict:
+    """One subscriber's coins out of the shared (union) crypto data, in their
+    watchlist order, names and first quote currency
+    """
+    # snapshots recorded before entries carried their id are keyed by name
+    by_id = {entry.get('id', name.lower()): entry for name, entry in crypto.items()}
+    currency = watchlist_currencies(money_config)[0]
+
+    selected = {}
+    for coin, name in watchlist_coins(money_config).items():
+        entry = by_id.get(coin)
+        if entry and currency in entry.get('prices', {}):
+            selected[name] = _in_currency(entry, currency)
+    return selected
+
+
+def pair_label(pair: str) -> str:
+    """"eur/gbp" -> "EUR → GBP", the key a pair is shown under"""
+    base, _, quote = pair.upper().replace(' ', '').partition('/')
+    return f'{base} → {quote}'
+
+
+def _round_rate(rate: float) -> float:
+    """Two decimals, or four significant digits for rates below 1 (e.g. JPY → USD)"""
+    return round(rate, 2) if rate >= 1 else float(f'{rate:.4g}')
+
 
 class MoneyInfo:
     def __init__(self, config_json):
         self.config = config_json
+        # provider results for this run, see _memoized
+        self._memo: Dict[str, Any] = {}
+        # sections served from an older snapshot: {section: taken_at timestamp}
+        self.stale: Dict[str, float] = {}
 
     def get_crypto(self) -> Dict:
-        """Get Bitcoin and Ethereum prices"""
+        """Get prices for the coins in money.crypto_watchlist (Bitcoin and Ethereum by default)
+
+        Every coin and quote currency goes into one simple/price request
+        (split in batches of COINGECKO_BATCH coins for very long lists).
+        'price' and 'change_24h' are in 'currency', the first quote currency;
+        'prices' and 'changes' hold all of them.
+        Returns: Dict of {coin name: {'id', 'currency', 'price', 'change_24h', 'prices', 'changes'}}
+        in watchlist order
+        """
+        money_config = self.config.get('money', {})
+        coins = watchlist_coins(money_config)
+        currencies = watchlist_currencies(money_config)
+
         try:
             url = 'https://api.coingecko.com/api/v3/simple/price'
-            params = {
-                'ids': 'bitcoin,ethereum',
-                'vs_currencies': 'usd',
-                'include_24hr_change': 'true'
-            }
-            response = requests.get(url, params=params, timeout=10)
-            data = response.json()
+            ids = list(coins)
+            data = {}
+            for start in range(0, len(ids), COINGECKO_BATCH):
+                params = {
+                    'ids': ','.join(ids[start:start + COINGECKO_BATCH]),
+                    'vs_currencies': ','.join(currencies),
+                    'include_24hr_change': 'true'
+                }
+                response = http_client.get(url, params=params)
+                response.raise_for_status()
+                data.update(response.json())
 
             # Format better
             result = {}
-            for crypto, info in data.items():
-                result[crypto.capitalize()] = {
-                    'price': info['usd'],
-                    'change_24h': round(info.get('usd_24h_change', 0), 2)
+            for coin, name in coins.items():
+                info = data.get(coin)
+                if not info:
+                    continue
+                entry = {
+                    'id': coin,
+                    'prices': {currency: info[currency] for currency in currencies if currency in info},
+                    'changes': {currency: round(info.get(f'{currency}_24h_change') or 0, 2)
+                                for currency in currencies if currency in info},
                 }
+                if currencies[0] in entry['prices']:
+                    result[name] = _in_currency(entry, currencies[0])
             return result
 
         except Exception as e:
             print(f"Error fetching crypto: {e}")
             return {}
 
-    def get_exchange_rates(self) -> Dict:
-        """Get exchange rates"""
+    def get_exchange_rates(self, pairs: List[str] = None) -> Dict:
+        """Get exchange rates for every pair in money.exchange_pairs ("EUR/GBP", ...)
+
+        A single USD rate table is fetched (cached for money.cache_ttl.exchange
+        seconds) and every cross rate is derived from it locally, so any
+        number of pairs costs at most one request.
+        Returns: Dict of {'BASE → QUOTE': rate}
+        """
+        self._memoized('exchange', self._fetch_usd_rates)
+        return self.cross_rates(pairs)
+
+    def cross_rates(self, pairs: List[str] = None) -> Dict:
+        """Rates for `pairs` (default money.exchange_pairs) from the USD table
+        this instance already loaded, never touches the network
+        Returns: Dict of {'BASE → QUOTE': rate}, empty if no table was loaded
+        """
+        pairs = pairs or self.config.get('money', {}).get('exchange_pairs') or DEFAULT_EXCHANGE_PAIRS
+        rates = self._memo.get('exchange')
+        if not rates:
+            return {}
+
+        result = {}
+        for pair in pairs:
+            base, _, quote = pair.upper().replace(' ', '').partition('/')
+            if base not in rates or quote not in rates:
+                print(f"Unknown currency pair: {pair}")
+                continue
+            # both legs are quoted against USD: base → quote = USD→quote / USD→base
+            result[pair_label(pair)] = _round_rate(rates[quote] / rates[base])
+        return result
+
+    def _fetch_usd_rates(self) -> Dict[str, float]:
+        """USD rate table from exchangerate-api
+        Returns: Dict of {currency: units per 1 USD}
+        """
         try:
             url = 'https://api.exchangerate-api.com/v4/latest/USD'
-            response = requests.get(url, timeout=10)
+            response = http_client.get(url)
+            response.raise_for_status()
             data = response.json()
 
-            rates = data['rates']
-            return {
-                'USD → EUR': round(rates['EUR'], 2),
-                'USD → GBP': round(rates['GBP'], 2),
-                'USD → JPY': round(rates['JPY'], 2),
-                'USD → CNH': round(rates['CNH'], 2),
-                'USD → CAD': round(rates['CAD'], 2),
-                'USD → CHF': round(rates['CHF'], 2),
-                'USD → BRL': round(rates['BRL'], 2),
-                'USD → RUB': round(rates['RUB'], 2),
-            }
+            rates = dict(data['rates'])
+            rates['USD'] = 1.0
+            return rates
         except Exception as e:
             print(f"Error fetching rates: {e}")
             return {}
 
+    def _memoized(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """Result of `fetch`, memoized for this run and cached across runs
+        for money.cache_ttl[key] seconds (nothing cached if 0 or missing)
+        Returns: the cached or freshly fetched value, empty results aren't cached
+        """
+        if key in self._memo:
+            return self._memo[key]
+
+        ttl = self.config.get('money', {}).get('cache_ttl', {}).get(key, 0)
+        value = result_cache.get(f'money:{key}', ttl)
+        if value is None:
+            value = fetch()
+            if ttl and value:
+                result_cache.put(f'money:{key}', value)
+
+        self._memo[key] = value
+        return value
+
     def get_precious_metals(self) -> Dict:
         """Get Gold, Silver, Platinum prices (USD per troy ounce)
-        Uses free API from metals-api.com alternative
+        One batched futures quote for all three metals, memoized per run
         """
+        return self._memoized('metals', self._fetch_precious_metals)
+
+    def _fetch_precious_metals(self) -> Dict:
         try:
-            # Alternative 1: Gold API (free, no key needed for basic)
-            url = 'https://www.goldapi.io/api/XAU/USD'
-            headers = {'x-access-token': 'goldapi-demo'}  # Demo key (limited but works)
+            quotes = self._get_yahoo_quotes(list(METAL_SYMBOLS.values()))
+            prices = {name: quotes[symbol][0] for name, symbol in METAL_SYMBOLS.items() if symbol in quotes}
 
-            response = requests.get(url, headers=headers, timeout=10)
+            if 'Gold (XAU)' not in prices:
+                # Fallback: a single gold quote, the others derived from it
+                prices['Gold (XAU)'] = self._get_gold_price()
 
-            if response.status_code == 200:
-                gold_data = response.json()
-                gold_price = gold_data.get('price', 0)
-            else:
-                # Fallback: scrape from public source
-                gold_price = self._scrape_gold_price()
-
-            # Get Silver and Platinum (from same source or fallback)
-            silver_price = self._get_metal_price('silver')
-            platinum_price = self._get_metal_price('platinum')
-
-            return {
-                'Gold (XAU)': round(gold_price, 2),
-                'Silver (XAG)': round(silver_price, 2),
-                'Platinum (XPT)': round(platinum_price, 2),
-            }
+            gold_price = prices['Gold (XAU)']
+            if not gold_price:
+                return {}
+            prices.setdefault('Silver (XAG)', self._get_metal_price('silver', gold_price))
+            prices.setdefault('Platinum (XPT)', self._get_metal_price('platinum', gold_price))
+
+            return {name: round(prices[name], 2) for name in METAL_SYMBOLS}
 
         except Exception as e:
             print(f"Error fetching metals: {e}")
             return {}
 
+    def _get_gold_price(self) -> float:
+        """Gold from goldapi, or scraped from a public page if that fails"""
+        try:
+            # Gold API (free, no key needed for basic)
+            url = 'https://www.goldapi.io/api/XAU/USD'
+            headers = {'x-access-token': 'goldapi-demo'}  # Demo key (limited but works)
+
+            response = http_client.get(url, headers=headers)
+            if response.status_code == 200:
+                return response.json().get('price', 0)
+        except Exception as e:
+            print(f"Error fetching gold from goldapi: {e}")
+
+        # Fallback: scrape from public source
+        return self._scrape_gold_price()
+
     def _scrape_gold_price(self) -> float:
         """Fallback: scrape gold price from public source"""
         try:
             url = 'https://www.goldprice.org/'
-            response = requests.get(url, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            response = http_client.get(url)
+            soup = BeautifulSoup(response.text, 'html.parser', parse_only=SoupStrainer('div', {'id': 'xau_usd_price'}))
 
             # Find gold price element (adjust selector if needed)
             price_elem = soup.find('div', {'id': 'xau_usd_price'})
@@ -115,34 +335,40 @@ class MoneyInfo:
         except:
             return 0.0
 
-    def _get_metal_price(self, metal: str) -> float:
-        """Get silver/platinum price (simplified)"""
+    def _get_metal_price(self, metal: str, gold_price: float) -> float:
+        """Estimate silver/platinum from the gold price"""
         # Approximate ratios (Gold is ~80x Silver, ~2x Platinum)
-        # In real app, use proper API or scraping
-        gold_price = 2000  # Fallback estimate
-
         if metal == 'silver':
-            return gold_price / 80  # ~$25/oz
+            return gold_price / 80
         elif metal == 'platinum':
-            return gold_price * 0.5  # ~$1000/oz
+            return gold_price * 0.5
         return 0.0
 
     def get_stock_indices(self) -> Dict:
-        """Get major stock indices (S&P 500, Dow Jones, Nasdaq)
-        Scrapes from Yahoo Finance (free, no API key)
+        """Get the indices in money.stock_indices (S&P 500, Dow Jones, Nasdaq by default)
+        Batched through Yahoo's spark JSON endpoint, YAHOO_SPARK_BATCH symbols per
+        request; symbols it doesn't return are scraped from their Yahoo quote
+        pages, concurrently (free, no API key)
+        Returns: Dict of {name: {'price', 'change'}}
         """
         try:
-            indices = {
-                'S&P 500': '^GSPC',
-                'Dow Jones': '^DJI',
-                'Nasdaq': '^IXIC',
-                'FTSE 100': '^FTSE',
-            }
+            indices = self.config.get('money', {}).get('stock_indices') or DEFAULT_INDICES
+
+            # One JSON request for every symbol, quote pages only for what it missed
+            quotes = self._get_yahoo_quotes(list(indices.values()))
+            missing = [symbol for symbol in indices.values() if symbol not in quotes]
+            if missing:
+                quotes.update(run_concurrently(
+                    {symbol: lambda symbol=symbol: self._get_yahoo_quote(symbol) for symbol in missing},
+                    max_workers=len(missing),
+                    timeout=30,
+                    defaults={symbol: (0.0, 0.0) for symbol in missing},
+                ))
 
             results = {}
 
             for name, symbol in indices.items():
-                price, change = self._get_yahoo_quote(symbol)
+                price, change = quotes.get(symbol, (0.0, 0.0))
                 if price:
                     results[name] = {
                         'price': round(price, 2),
@@ -155,6 +381,25 @@ class MoneyInfo:
             print(f"Error fetching stocks: {e}")
             return {}
 
+    def _get_yahoo_quotes(self, symbols: List[str]) -> Dict[str, Tuple[float, float]]:
+        """Batched quotes from Yahoo's JSON spark endpoint, no HTML involved
+        Returns: Dict of {symbol: (price, change)} for the symbols it could read
+        """
+        quotes = {}
+        for start in range(0, len(symbols), YAHOO_SPARK_BATCH):
+            batch = symbols[start:start + YAHOO_SPARK_BATCH]
+            try:
+                response = http_client.get(
+                    YAHOO_SPARK_URL,
+                    params={'symbols': ','.join(batch), 'range': '1d', 'interval': '1d'},
+                    headers=YAHOO_HEADERS,
+                )
+                response.raise_for_status()
+                quotes.update(_parse_spark(response.json()))
+            except Exception as e:
+                print(f"Error getting batched quotes for {', '.join(batch)}: {e}")
+        return quotes
+
     def _get_yahoo_quote(self, symbol: str) -> tuple:
         """Scrape stock quote from Yahoo Finance"""
         try:
@@ -162,7 +407,7 @@ class MoneyInfo:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            response = requests.get(url, headers=headers, timeout=10)
+            response = http_client.get(url, headers=headers)
             soup = BeautifulSoup(response.text, 'html.parser')
 
             # Find price (adjust selectors if Yahoo changes layout)
@@ -179,89 +424,73 @@ class MoneyInfo:
             return 0.0, 0.0
 
     def get_money(self) -> Dict:
-        """Get all financial data based on config"""
-        money_config = self.config.get('money', {})
-
-        result = {}
-
-        if money_config.get('crypto', False):
-            result['crypto'] = self.get_crypto()
-
-        if money_config.get('exchange', False):
-            result['exchange_rates'] = self.get_exchange_rates()
-
-        if money_config.get('metals', False):
-            result['precious_metals'] = self.get_precious_metals()
-
-        if money_config.get('stocks', False):
-            result['stock_indices'] = self.get_stock_indices()
-
-        return result
+        """Get all financial data based on config
 
+        The providers live on independent hosts, so the enabled ones run at
+        once, each with its own deadline (money.timeouts, default 20s). A
+        slow or failing provider falls back to its last good snapshot from
+        the market history (money.history), or leaves its section empty.
+        """
+        money_config = self.config.get('money', {})
 
-class RssFinanceFeed:
-    def __init__(self, config_json):
-        self.config = config_json
-        self.news_list = []
-
-    def _fetch_rss(self, url: str, source_name: str, limit: int = 2) -> List[Tuple[str, str]]:
-        """Generic RSS fetcher"""
-        try:
-            feed = feedparser.parse(url)
-            results = []
-
-            for entry in feed.entries[:limit]:
-                title = entry.get("title", "No title")
-                link = entry.get("link", "")
-                results.append((title, link))
-
-            return results
-
-        except Exception as e:
-            print(f"Error fetching {source_name} RSS: {e}")
-            return []
-
-    def bloomberg_rss(self) -> List[Tuple[str, str]]:
-        return self._fetch_rss(
-            'https://feeds.bloomberg.com/markets/news.rss',
-            'Bloomberg',
-            limit=3
-        )
-
-    def financial_times_rss(self) -> List[Tuple[str, str]]:
-        return self._fetch_rss(
-            'https://www.ft.com/?format=rss',
-            'Financial Times',
-            limit=3
+        providers = {
+            'crypto': ('crypto', self.get_crypto),
+            'exchange_rates': ('exchange', self.get_exchange_rates),
+            'precious_metals': ('metals', self.get_precious_metals),
+            'stock_indices': ('stocks', self.get_stock_indices),
+        }
+        jobs = {key: fetch for key, (flag, fetch) in providers.items() if money_config.get(flag, False)}
+        timeouts = money_config.get('timeouts', {})
+
+        results = run_concurrently(
+            jobs,
+            max_workers=len(jobs),
+            timeout=timeouts.get('default', 20),
+            timeouts={key: timeouts[flag] for key, (flag, _) in providers.items() if flag in timeouts},
+            defaults={key: {} for key in jobs},
         )
+        # keep the sections in provider order, whatever finished first
+        results = {key: results.get(key) or {} for key in jobs}
 
-    def coindesk_rss(self) -> List[Tuple[str, str]]:
-        return self._fetch_rss(
-            'https://www.coindesk.com/arc/outboundfeeds/rss',
-            'CoinDesk',
-            limit=3
-        )
+        history_config = money_config.get('history', {})
+        if history_config.get('enabled'):
+            results = self._apply_history(results, MarketHistory(
+                retention_days=history_config.get('retention_days', 90)
+            ), max_age_days=history_config.get('max_fallback_age_days', 3))
 
-    def get_news(self) -> List[Tuple[str, str, str]]:
-        self.news_list = []
-        rss_config = self.config.get("rss_feeds", {})
+        return results
 
-        if rss_config.get("blb_rss"):
-            print("Fetching Bloomberg RSS...")
-            for title, link in self.bloomberg_rss():
-                self.news_list.append(("Bloomberg", title, link))
+    def _apply_history(self, results: Dict, history: MarketHistory, max_age_days: float = 3) -> Dict:
+        """Record fresh snapshots, fill failed providers from the last good one
+        (if younger than `max_age_days`, flagged in self.stale) and add
+        week-over-week changes and trends to per-asset entries
+        """
+        for key, data in results.items():
+            if data:
+                history.record(key, data)
+                continue
+            last = history.last(key, max_age_days)
+            if last:
+                snapshot, taken_at = last
+                print(f"   Serving last good {key} snapshot from {datetime.fromtimestamp(taken_at):%Y-%m-%d %H:%M}")
+                results[key] = snapshot
+                self.stale[key] = taken_at
+
+        if results.get('crypto'):
+            # per quote currency, then shown in the entry's own one
+            results['crypto'] = {
+                name: _in_currency(entry, entry['currency']) if entry.get('prices') else entry
+                for name, entry in history.enrich_by_currency('crypto', results['crypto']).items()
+            }
+        if results.get('stock_indices'):
+            results['stock_indices'] = history.enrich('stock_indices', results['stock_indices'])
 
-        if rss_config.get("fnt_rss"):
-            print("Fetching Financial Times RSS...")
-            for title, link in self.financial_times_rss():
-                self.news_list.append(("Financial Times", title, link))
+        return results
 
-        if rss_config.get("cnd_rss"):
-            print("Fetching CoinDesk RSS...")
-            for title, link in self.coindesk_rss():
-                self.news_list.append(("CoinDesk", title, link))
 
-        return self.news_list
+class RssFinanceFeed(RegistryFeed):
+    """Finance news feeds, rows live in configs/feeds.json"""
+    category = 'finance'
 
 
 if __name__ == "__main__":
@@ -283,7 +512,7 @@ if __name__ == "__main__":
         print("\nEXCHANGE RATES")
         print("-" * 50)
         for pair, rate in data['exchange_rates'].items():
-            print(f"$1 {pair}: {rate}")
+            print(f"1 {pair}: {rate}")
 
     # Display Metals
     if 'precious_metals' in data:
@@ -306,7 +535,7 @@ if __name__ == "__main__":
     print("\nFINANCE NEWS")
     print("-" * 50)
     rss = RssFinanceFeed(config_data)
-    news = rss.get_news()
+    news = run_feed_tasks(rss.get_news())[0]
 
     for source, title, link in news[:6]:
         print(f"\n{source}: {title}")
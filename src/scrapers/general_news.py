@@ -1,9 +1,10 @@
-import requests
 import json
-from bs4 import BeautifulSoup
 from pathlib import Path
 from typing import List,Dict
 
+from src.utils.safe_scrape import _safe_scrape
+from src.utils.scheduler import run_concurrently
+
 
 #load config with proper path
 config_path = Path(__file__).parent.parent / 'configs' / 'config.json'
@@ -26,35 +27,7 @@ class NewsScraper:
 
     def _safe_scrape(self, url: str, tag: str, attrs: Dict) -> tuple:
         """Helper to safely scrape with error handling"""
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            element = soup.find(tag, attrs)
-            if element:
-                #get link
-                title = element.text.strip()
-
-                # if element is <a>, get href
-                if tag == 'a':
-                    link = element.get('href', url)
-                else:
-
-                    a_tag = element.find('a') or element.find_parent('a')
-                    link = a_tag.get('href', url) if a_tag else url
-
-
-                if link.startswith('/'):
-                    from urllib.parse import urljoin
-                    link = urljoin(url, link)
-
-                return title, link
-            else:
-                return f"[Element not found]", url
-
-        except Exception as e:
-            return f"[Error: {str(e)}]", url
+        return _safe_scrape(url, tag, attrs)
 
     def get_cnn_news(self) -> tuple:
         #get CNN main headline with link
@@ -113,49 +86,35 @@ class NewsScraper:
         )
 
     def get_news(self) -> List[tuple]:
-        """Fetch all enabled news sources from config json"""
-        self.news_list = []
-
+        """Fetch all enabled news sources from config json, all at once"""
         scrapers_config = self.config.get("web_scrapper", {})
 
-        if scrapers_config.get("cnn_news"):
-            print("Fetching CNN...")
-            title, link = self.get_cnn_news()
-            self.news_list.append(("CNN", title, link))
-
-        if scrapers_config.get("bbc_news"):
-            print("Fetching BBC...")
-            title, link = self.get_bbc_news()
-            self.news_list.append(("BBC", title, link))
-
-        if scrapers_config.get("nyt_news"):
-            print("Fetching NYT...")
-            title, link = self.get_nyt_news()
-            self.news_list.append(("NYT", title, link))
-
-        if scrapers_config.get("frb_news"):
-            print("Fetching Forbes...")
-            title, link = self.get_forbes_news()
-            self.news_list.append(("Forbes", title, link))
-
-        if scrapers_config.get("fxn_news"):
-            print("Fetching Fox News...")
-            title, link = self.get_foxnews_news()
-            self.news_list.append(("Fox News", title, link))
-
-        if scrapers_config.get("jcb_news"):
-            print("Fetching Jacobin...")
-            title, link = self.get_jacobin_news()
-            self.news_list.append(("Jacobin", title, link))
-
-        if scrapers_config.get("ono_news"):
-            print("Fetching The Onion...")
-            title, link = self.get_onion_news()
-            self.news_list.append(("The Onion", title, link))
+        jobs = {}
+        for key, source, scraper in [
+            ("cnn_news", "CNN", self.get_cnn_news),
+            ("bbc_news", "BBC", self.get_bbc_news),
+            ("nyt_news", "NYT", self.get_nyt_news),
+            ("frb_news", "Forbes", self.get_forbes_news),
+            ("fxn_news", "Fox News", self.get_foxnews_news),
+            ("jcb_news", "Jacobin", self.get_jacobin_news),
+            ("ono_news", "The Onion", self.get_onion_news),
+        ]:
+            if scrapers_config.get(key):
+                print(f"Fetching {source}...")
+                jobs[source] = scraper
+
+        # Every page is fetched and parsed on its own thread
+        results = run_concurrently(
+            jobs,
+            max_workers=len(jobs),
+            timeout=30,
+            defaults={source: ("[Error: timed out]", "") for source in jobs},
+        )
 
+        # keep the config order, whatever finished first
+        self.news_list = [(source, *results[source]) for source in jobs]
         return self.news_list
 
-
 if __name__ == '__main__':
 
     test=NewsScraper(config_data)
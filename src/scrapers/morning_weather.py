@@ -5,7 +5,14 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from pathlib import Path
 import json
+import re
 import time
+import atexit
+import unicodedata
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.image_optimizer import crop_image, optimize_image
 
 # ===== PATHS =====
 screenshot_dir = Path(__file__).parent.parent / 'imgs'
@@ -22,7 +29,36 @@ except FileNotFoundError:
     print(f'config.json not found at {config_path}')
     config_data = {}
 
-city = config_data.get('weather', {}).get('city', 'London')
+VENTUSKY_URL = "https://www.ventusky.com"
+
+
+def get_cities(weather_config=None):
+    """Cities from the weather config, 'city' may be a single name or a list"""
+    weather_config = config_data.get('weather', {}) if weather_config is None else weather_config
+    configured = weather_config.get('city', 'London')
+    if isinstance(configured, str):
+        return [configured]
+    return list(configured) or ['London']
+
+
+cities = get_cities()
+# First configured city, kept for single-city callers
+city = cities[0]
+
+
+def _city_slug(city_name):
+    ascii_name = unicodedata.normalize('NFKD', city_name).encode('ascii', 'ignore').decode()
+    return re.sub(r'[^a-z0-9]+', '_', ascii_name.lower()).strip('_') or 'city'
+
+
+def screenshot_path_for(city_name):
+    """Image file for a city's radar capture"""
+    return screenshot_dir / f"morning_weather_{_city_slug(city_name)}.png"
+
+
+def content_id_for(city_name):
+    """Content-ID used to embed a city's radar image in the email"""
+    return f"weather_map_{_city_slug(city_name)}"
 
 
 def get_chrome_options(headless=True):
@@ -56,6 +92,47 @@ def get_chrome_options(headless=True):
     return chrome_options
 
 
+def _wait_for_page_ready(driver, timeout=20):
+    """Wait until the document has finished loading"""
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script('return document.readyState') == 'complete'
+    )
+
+
+def _wait_for_map_idle(driver, quiet=0.75, timeout=15):
+    """Wait until the map stops loading tiles
+
+    Ventusky draws radar tiles on a canvas, so the best readiness signal is
+    the network going quiet: no new resource entries for `quiet` seconds.
+    Returns True if the map settled before the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    last_count = -1
+    last_change = time.monotonic()
+
+    while time.monotonic() < deadline:
+        count = driver.execute_script(
+            "return performance.getEntriesByType('resource').length"
+        )
+        now = time.monotonic()
+        if count != last_count:
+            last_count = count
+            last_change = now
+        elif now - last_change >= quiet:
+            return True
+        time.sleep(0.1)
+
+    return False
+
+
+def _reset_resource_timings(driver):
+    """Start counting map requests from zero for the next idle check"""
+    driver.execute_script(
+        "performance.setResourceTimingBufferSize(10000);"
+        "performance.clearResourceTimings();"
+    )
+
+
 def weather_mode(driver):
     """Switch to radar mode"""
     try:
@@ -63,16 +140,43 @@ def weather_mode(driver):
         radar_button = wait.until(
             EC.element_to_be_clickable((By.CLASS_NAME, 'rain'))
         )
+        _reset_resource_timings(driver)
         radar_button.click()
+        _wait_for_map_idle(driver)
         print('   ✓ Radar mode activated')
-        time.sleep(3)
         return True
     except Exception as e:
         print(f'   ✗ Failed to activate radar mode: {e}')
         return False
 
 
-def searchbar_search(driver, city):
+def _click_first_result(driver, search_box, city):
+    """Click the dropdown entry for the city, falling back to coordinates"""
+    # The suggestion list renders right after the search box and mentions the city
+    city_lower = city.lower().replace("'", "")
+    result_xpath = (
+        "//input[@id='search-q']/following::*[self::a or self::li]"
+        "[contains(translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', "
+        f"'abcdefghijklmnopqrstuvwxyz'), '{city_lower}')]"
+    )
+    try:
+        result = WebDriverWait(driver, 5).until(
+            EC.element_to_be_clickable((By.XPATH, result_xpath))
+        )
+        result.click()
+        return True
+    except Exception:
+        pass
+
+    # Fallback: click just below the search box where the first result sits
+    y_offset = search_box.size['height'] + 10
+    actions = ActionChains(driver)
+    actions.move_to_element(search_box).perform()
+    actions.move_by_offset(0, y_offset).click().perform()
+    return True
+
+
+def searchbar_search(driver, city, wait_for_map=True):
     """Search for city"""
     try:
         wait = WebDriverWait(driver, 10)
@@ -82,36 +186,20 @@ def searchbar_search(driver, city):
 
         search_box.click()
         search_box.clear()
-        time.sleep(0.5)
-
-        # Type city
-        for char in city:
-            search_box.send_keys(char)
-            time.sleep(0.15)
-
+        search_box.send_keys(city)
         print(f'   ✓ Typed: {city}')
-        time.sleep(2)
 
-        # Click first dropdown result using coordinates
+        # Click first dropdown result
         try:
-            location = search_box.location
-            size = search_box.size
-
-            x_offset = size['width'] // 2
-            y_offset = size['height'] + 10
-
-            # Move and click
-            actions = ActionChains(driver)
-            actions.move_to_element(search_box).perform()
-            time.sleep(0.3)
-            actions.move_by_offset(0, y_offset).click().perform()
-
+            _reset_resource_timings(driver)
+            _click_first_result(driver, search_box, city)
             print('   ✓ Selected city from dropdown')
-            time.sleep(3)
+            if wait_for_map:
+                _wait_for_map_idle(driver)
             return True
 
         except Exception as e:
-            print(f"   ⚠️  Coordinate click failed: {e}")
+            print(f"   ⚠️  Dropdown click failed: {e}")
             return False
 
     except Exception as e:
@@ -119,14 +207,40 @@ def searchbar_search(driver, city):
         return False
 
 
-def take_screenshot(driver):
-    """Take and save screenshot"""
-    try:
-        driver.save_screenshot(str(file_path))
+def _map_viewport(driver):
+    """Screenshot-pixel box (left, top, right, bottom) of the radar map canvas"""
+    crop = config_data.get('weather', {}).get('image', {}).get('crop')
+    if crop:
+        return tuple(crop)
 
-        if file_path.exists():
-            size = file_path.stat().st_size / 1024
-            print(f"   ✓ Screenshot saved: {file_path.name} ({size:.1f} KB)")
+    return driver.execute_script("""
+        const canvases = Array.from(document.querySelectorAll('canvas'));
+        if (!canvases.length) return null;
+        const area = c => c.getBoundingClientRect().width * c.getBoundingClientRect().height;
+        const rect = canvases.reduce((a, b) => area(a) >= area(b) ? a : b).getBoundingClientRect();
+        const ratio = window.devicePixelRatio || 1;
+        const right = Math.min(rect.right, window.innerWidth);
+        const bottom = Math.min(rect.bottom, window.innerHeight);
+        return [Math.max(0, rect.left) * ratio, Math.max(0, rect.top) * ratio, right * ratio, bottom * ratio]
+            .map(Math.round);
+    """)
+
+
+def take_screenshot(driver, path=file_path):
+    """Take and save screenshot, cropped to the map viewport"""
+    try:
+        driver.save_screenshot(str(path))
+
+        if path.exists():
+            try:
+                viewport = _map_viewport(driver)
+                if viewport:
+                    crop_image(path, tuple(viewport))
+            except Exception as e:
+                print(f"   ⚠️  Could not crop to map: {e}")
+
+            size = path.stat().st_size / 1024
+            print(f"   ✓ Screenshot saved: {path.name} ({size:.1f} KB)")
             return True
         else:
             print("   ✗ Screenshot file not created!")
@@ -137,71 +251,326 @@ def take_screenshot(driver):
         return False
 
 
-def capture_weather_screenshot(headless=True):
-    """
-    Main function to capture weather screenshot
-
-    Args:
-        headless: Run browser in headless mode (True for automation)
+class WeatherBrowser:
+    """Chrome session that keeps a warm Ventusky radar page between captures
 
-    Returns:
-        bool: True if successful, False otherwise
+    With a `debugger_address` (host:port of a Chrome started with
+    --remote-debugging-port) it attaches to that browser instead of launching
+    one, and leaves it running on close, so the radar tab stays warm across runs.
     """
-    driver = None
 
-    try:
-        print("\n🌤️  WEATHER SCREENSHOT CAPTURE")
-        print("-" * 50)
+    def __init__(self, headless=True, debugger_address=None):
+        self.headless = headless
+        self.debugger_address = debugger_address
+        self.driver = None
+        self._lock = threading.Lock()
+
+    def _attach(self):
+        """Connect to the running Chrome
+        Returns: True if it already has a Ventusky tab in radar mode
+        """
+        chrome_options = webdriver.ChromeOptions()
+        chrome_options.add_experimental_option('debuggerAddress', self.debugger_address)
+        self.driver = webdriver.Chrome(options=chrome_options)
+
+        for handle in self.driver.window_handles:
+            self.driver.switch_to.window(handle)
+            if self.driver.current_url.startswith(VENTUSKY_URL):
+                return True
+        return False
 
-        # Initialize driver
-        chrome_options = get_chrome_options(headless=headless)
-        driver = webdriver.Chrome(options=chrome_options)
+    def _start(self):
+        """Launch (or attach to) Chrome and open Ventusky in radar mode"""
+        if self.debugger_address:
+            if self._attach():
+                print(f"1-2. Reusing warm Ventusky page at {self.debugger_address}")
+                return True
+        else:
+            chrome_options = get_chrome_options(headless=self.headless)
+            self.driver = webdriver.Chrome(options=chrome_options)
 
-        # 1. Open site
         print("1. Opening Ventusky...")
-        driver.get("https://www.ventusky.com")
-        if not headless:
-            driver.fullscreen_window()
+        self.driver.get(VENTUSKY_URL)
+        if not self.headless:
+            self.driver.fullscreen_window()
         else:
-            driver.set_window_size(1920, 1080)
-        time.sleep(3)
+            self.driver.set_window_size(1920, 1080)
+        _wait_for_page_ready(self.driver)
         print("   ✓ Site loaded")
 
-        # 2. Switch to rain radar
         print("2. Switching to radar mode...")
-        if not weather_mode(driver):
+        if not weather_mode(self.driver):
+            if self.debugger_address:
+                # don't leave a tab behind that the next run would take as warm
+                try:
+                    self.driver.get('about:blank')
+                except Exception:
+                    pass
+            self.close()
             return False
+        return True
 
-        # 3. Search city
-        print(f"3. Searching for {city}...")
-        if not searchbar_search(driver, city):
-            print("   ⚠️  Search failed, but continuing...")
+    def _is_alive(self):
+        try:
+            return self.driver is not None and bool(self.driver.current_url)
+        except Exception:
+            return False
+
+    def _ensure_started(self):
+        if self._is_alive():
+            print("1-2. Reusing warm Ventusky page")
+            return True
+        self.close()
+        return self._start()
+
+    def capture(self, city, path=file_path):
+        """Search the city on the warm page and save the screenshot"""
+        return self.capture_many({city: path}).get(city, False)
+
+    def capture_many(self, targets):
+        """
+        Capture several cities at once, one tab per city in this Chrome
+
+        All tabs are opened and searched first so their maps load in
+        parallel, then each one is screenshotted once its tiles settle.
+
+        Args:
+            targets: Dict of {city: screenshot_path}
+
+        Returns:
+            Dict of {city: bool}
+        """
+        results = {target_city: False for target_city in targets}
+
+        with self._lock:
+            if not targets or not self._ensure_started():
+                return results
+
+            driver = self.driver
+            main_handle = driver.current_window_handle
+            tabs = {}
+
+            for target_city in targets:
+                if not tabs:
+                    # The warm tab already sits in radar mode
+                    tabs[target_city] = main_handle
+                    continue
+                known = set(driver.window_handles)
+                driver.execute_script("window.open(arguments[0], '_blank');", VENTUSKY_URL)
+                new_handles = [h for h in driver.window_handles if h not in known]
+                if new_handles:
+                    tabs[target_city] = new_handles[0]
+
+            failed = set()
+            try:
+                # 3. Kick off every search without waiting for the map
+                for target_city, handle in tabs.items():
+                    driver.switch_to.window(handle)
+                    print(f"3. Searching for {target_city}...")
+                    if handle != main_handle:
+                        _wait_for_page_ready(driver)
+                        if not weather_mode(driver):
+                            failed.add(target_city)
+                            continue
+                    if not searchbar_search(driver, target_city, wait_for_map=False):
+                        print("   ⚠️  Search failed, but continuing...")
+
+                # 4. Screenshot each tab once its tiles have loaded
+                for target_city, handle in tabs.items():
+                    if target_city in failed:
+                        continue
+                    driver.switch_to.window(handle)
+                    print(f"4. Capturing {target_city}...")
+                    _wait_for_map_idle(driver)
+                    results[target_city] = take_screenshot(driver, targets[target_city])
+
+            finally:
+                for handle in tabs.values():
+                    if handle != main_handle:
+                        try:
+                            driver.switch_to.window(handle)
+                            driver.close()
+                        except Exception:
+                            pass
+                try:
+                    driver.switch_to.window(main_handle)
+                except Exception:
+                    self.close()
+
+        return results
+
+    def close(self):
+        """Quit Chrome, or only detach from it when it was attached to"""
+        if self.driver:
+            try:
+                if self.debugger_address:
+                    # stop chromedriver without closing the browser it attached to
+                    self.driver.service.stop()
+                else:
+                    self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+
+
+_persistent_browser = None
+
+
+def get_persistent_browser(headless=True, debugger_address=None):
+    """Long-lived browser shared by every capture in this process
+
+    It is closed at exit, so it only stays warm across runs when it is an
+    attached one (weather.debugger_address).
+    """
+    global _persistent_browser
+    if (_persistent_browser is None or _persistent_browser.headless != headless
+            or _persistent_browser.debugger_address != debugger_address):
+        if _persistent_browser:
+            _persistent_browser.close()
+        _persistent_browser = WeatherBrowser(headless=headless, debugger_address=debugger_address)
+    return _persistent_browser
+
+
+@atexit.register
+def close_persistent_browser():
+    global _persistent_browser
+    if _persistent_browser:
+        _persistent_browser.close()
+        _persistent_browser = None
 
-        # 4. Wait for map to load
-        print("4. Waiting for map to render...")
-        time.sleep(5)
 
-        # 5. Take screenshot
-        print("5. Capturing screenshot...")
-        success = take_screenshot(driver)
+def capture_radar_tiles(targets):
+    """
+    Render radar maps from tiles over plain HTTP (no browser)
+
+    Args:
+        targets: Dict of {city: image_path}
+
+    Returns:
+        Dict of {city: bool}
+    """
+    weather_config = config_data.get('weather', {})
+
+    try:
+        from src.scrapers.weather_tiles import render_radar_map
+    except ImportError as e:
+        print(f"   ⚠️  Tile renderer unavailable ({e})")
+        return {target_city: False for target_city in targets}
+
+    def _render(target_city):
+        try:
+            return render_radar_map(target_city, targets[target_city],
+                                    zoom=weather_config.get('zoom', 7))
+        except Exception as e:
+            print(f"   ✗ Tile renderer failed for {target_city}: {e}")
+            return False
+
+    print("\n🌤️  WEATHER RADAR (tiles)")
+    print("-" * 50)
+    with ThreadPoolExecutor(max_workers=max(1, len(targets))) as executor:
+        return dict(zip(targets, executor.map(_render, targets)))
+
+
+def capture_weather_screenshots(city_list=None, headless=True, persistent=None, backend=None):
+    """
+    Capture the radar for every configured city
+
+    Args:
+        city_list: Cities to capture (defaults to weather.city in config)
+        headless: Run browser in headless mode (True for automation)
+        persistent: Keep the browser open for later captures in this process
+                    (defaults to weather.persistent_browser in config).
+                    With weather.debugger_address set, the captures run in that
+                    already running Chrome, which is left open either way.
+        backend: 'tiles' to render from radar tiles, 'selenium' for a browser
+                 screenshot (defaults to weather.backend in config). Cities the
+                 tile backend fails on fall back to Selenium.
+
+    Returns:
+        Dict of {city: image_path} for the successful captures
+    """
+    weather_config = config_data.get('weather', {})
+    if city_list is None:
+        city_list = cities
+    if backend is None:
+        backend = weather_config.get('backend', 'selenium')
+    if persistent is None:
+        persistent = weather_config.get('persistent_browser', False)
+
+    targets = {target_city: screenshot_path_for(target_city) for target_city in city_list}
+    captured = {}
+
+    if backend == 'tiles':
+        for target_city, success in capture_radar_tiles(targets).items():
+            if success:
+                captured[target_city] = targets.pop(target_city)
+        if targets:
+            print("   Falling back to browser screenshot...")
+
+    if not targets:
+        return optimize_captures(captured)
+
+    debugger_address = weather_config.get('debugger_address')
+    if persistent:
+        browser = get_persistent_browser(headless, debugger_address)
+    else:
+        browser = WeatherBrowser(headless, debugger_address)
+
+    try:
+        print("\n🌤️  WEATHER SCREENSHOT CAPTURE")
+        print("-" * 50)
+
+        results = browser.capture_many(targets)
+        for target_city, success in results.items():
+            if success:
+                captured[target_city] = targets[target_city]
 
         print("-" * 50)
-        if success:
+        if all(results.values()):
             print("✅ WEATHER SCREENSHOT COMPLETE!\n")
         else:
             print("❌ SCREENSHOT FAILED!\n")
 
-        return success
-
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
         import traceback
         traceback.print_exc()
-        return False
 
     finally:
-        if driver:
-            driver.quit()
+        if not persistent:
+            browser.close()
+
+    return optimize_captures(captured)
+
+
+def optimize_captures(captured):
+    """Downsample and re-encode every capture for the email (weather.image config)
+    Returns: Dict of {city: optimized_image_path}
+    """
+    image_config = config_data.get('weather', {}).get('image', {})
+    if not image_config.get('optimize', True):
+        return captured
+
+    return {
+        target_city: optimize_image(
+            path,
+            width=image_config.get('width', 750),
+            fmt=image_config.get('format', 'jpeg'),
+            quality=image_config.get('quality', 80),
+        )
+        for target_city, path in captured.items()
+    }
+
+
+def capture_weather_screenshot(headless=True, persistent=None, backend=None):
+    """
+    Capture the radar for the first configured city
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return bool(capture_weather_screenshots([city], headless=headless,
+                                            persistent=persistent, backend=backend))
 
 
 # For backwards compatibility
@@ -212,5 +581,5 @@ def main():
 
 if __name__ == '__main__':
     # Run with browser visible for testing
-    # For production, use: capture_weather_screenshot(headless=True)
-    capture_weather_screenshot(headless=False)
\ No newline at end of file
+    # For production, use: capture_weather_screenshots(headless=True)
+    capture_weather_screenshots(headless=False)
@@ -1,7 +1,8 @@
 import json
-import feedparser
 from pathlib import Path
-from typing import List, Tuple
+
+from src.scrapers.feed_registry import RegistryFeed
+from src.utils.feed_fetcher import run_feed_tasks
 
 #load config with proper path
 config_path = Path(__file__).parent.parent / 'configs' / 'config.json'
@@ -14,86 +15,14 @@ except FileNotFoundError:
     config_data = {}
 
 
-class RssSportsFeed:
-    def __init__(self, config_json):
-        self.config = config_json
-        self.news_list = []
-
-    def _fetch_rss(self, url: str, source_name: str, limit: int = 3) -> List[Tuple[str, str]]:
-        """Generic RSS fetcher"""
-        try:
-            feed = feedparser.parse(url)
-            results = []
-
-            for entry in feed.entries[:limit]:
-                title = entry.get("title", "No title")
-                link = entry.get("link", "")
-                results.append((title, link))
-
-            return results
-
-        except Exception as e:
-            print(f"Error fetching {source_name} RSS: {e}")
-            return []
-
-
-
-    def espn_rss(self) -> List[Tuple[str, str]]:
-        """Get ESPN RSS feed (top x limit set)"""
-        return self._fetch_rss(
-            'https://www.espn.com/espn/rss/news',
-            'ESPN',
-            limit=3
-        )
-
-    def bbc_sports_rss(self) -> List[Tuple[str, str]]:
-        """Get BBC Sports RSS feed (top x limit set)"""
-        return self._fetch_rss(
-            'http://feeds.bbci.co.uk/sport/rss.xml',
-            'BBC Sports',
-            limit=3
-        )
-
-    def sky_sports_rss(self) -> List[Tuple[str, str]]:
-        """Get Sky Sports RSS feed (top x limit set)"""
-        return self._fetch_rss(
-                'http://feeds.skynews.com/feeds/rss/sports.xml',
-            'Sky Sports',
-            limit=3
-        )
-
-
-
-    def get_news(self) -> List[Tuple[str, str, str]]:
-        """Fetch all enabled RSS news sources
-        Returns: List of (source, title, link)
-        """
-        self.news_list = []
-
-        rss_config = self.config.get("rss_feeds", {})
-
-        if rss_config.get("epn_rss"):
-            print("Fetching ESPN RSS...")
-            for title, link in self.espn_rss():
-                self.news_list.append(("ESPN", title, link))
-
-        if rss_config.get("bsp_rss"):
-            print("Fetching BBC Sports RSS...")
-            for title, link in self.bbc_sports_rss():
-                self.news_list.append(("BBC Sports", title, link))
-
-        if rss_config.get("sky_rss"):
-            print("Fetching Sky Sports RSS...")
-            for title, link in self.sky_sports_rss():
-                self.news_list.append(("Sky Sports", title, link))
-
-
-        return self.news_list
+class RssSportsFeed(RegistryFeed):
+    """Sports news feeds, rows live in configs/feeds.json"""
+    category = 'sports'
 
 
 if __name__ == "__main__":
     rss = RssSportsFeed(config_data)
-    news = rss.get_news()
+    news = run_feed_tasks(rss.get_news())[0]
 
     print("\nRSS Headlines\n")
     for source, title, link in news:
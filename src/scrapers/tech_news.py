@@ -1,7 +1,8 @@
 import json
-import feedparser
 from pathlib import Path
-from typing import List, Tuple
+
+from src.scrapers.feed_registry import RegistryFeed
+from src.utils.feed_fetcher import run_feed_tasks
 
 #load config with proper path
 config_path = Path(__file__).parent.parent / 'configs' / 'config.json'
@@ -14,83 +15,14 @@ except FileNotFoundError:
     config_data = {}
 
 
-class RssTechFeed:
-    def __init__(self, config_json):
-        self.config = config_json
-        self.news_list = []
-
-    def _fetch_rss(self, url: str, source_name: str, limit: int = 3) -> List[Tuple[str, str]]:
-        """Generic RSS fetcher"""
-        try:
-            feed = feedparser.parse(url)
-            results = []
-
-            for entry in feed.entries[:limit]:
-                title = entry.get("title", "No title")
-                link = entry.get("link", "")
-                results.append((title, link))
-
-            return results
-
-        except Exception as e:
-            print(f"Error fetching {source_name} RSS: {e}")
-            return []
-
-
-
-    def techcrunch_rss(self) -> List[Tuple[str, str]]:
-        """Get TechCrunch RSS feed (top x limit set)"""
-        return self._fetch_rss(
-            'https://techcrunch.com/feed/',
-            'TechCrunch',
-            limit=3
-        )
-
-    def hackernews_rss(self) -> List[Tuple[str, str]]:
-        """Get Hacker News RSS feed (top x limit set)"""
-        return self._fetch_rss(
-            'https://hnrss.org/frontpage',
-            'Hacker News',
-            limit=3
-        )
-
-    def arstechnica_rss(self) -> List[Tuple[str, str]]:
-        """Get Ars Technica RSS feed (top x limit set)"""
-        return self._fetch_rss(
-            'https://feeds.arstechnica.com/arstechnica/index',
-            'Ars Technica',
-            limit=3
-        )
-
-    def get_news(self) -> List[Tuple[str, str, str]]:
-        """Fetch all enabled RSS news sources
-        Returns: List of (source, title, link)
-        """
-        self.news_list = []
-
-        rss_config = self.config.get("rss_feeds", {})
-
-        if rss_config.get("tec_rss"):
-            print("Fetching TechCrunch RSS...")
-            for title, link in self.techcrunch_rss():
-                self.news_list.append(("TechCrunch", title, link))
-
-        if rss_config.get("hac_rss"):
-            print("Fetching Hacker News RSS...")
-            for title, link in self.hackernews_rss():
-                self.news_list.append(("Hacker News", title, link))
-
-        if rss_config.get("ars_rss"):
-            print("Fetching Ars Technica RSS...")
-            for title, link in self.arstechnica_rss():
-                self.news_list.append(("Ars Technica", title, link))
-
-        return self.news_list
+class RssTechFeed(RegistryFeed):
+    """Tech news feeds, rows live in configs/feeds.json"""
+    category = 'tech'
 
 
 if __name__ == "__main__":
     rss = RssTechFeed(config_data)
-    news = rss.get_news()
+    news = run_feed_tasks(rss.get_news())[0]
 
     print("\nRSS Headlines\n")
     for source, title, link in news:
@@ -0,0 +1,164 @@
+import io
+import math
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from src.utils import http_client
+
+GEOCODE_URL = 'https://geocoding-api.open-meteo.com/v1/search'
+RADAR_INDEX_URL = 'https://api.rainviewer.com/public/weather-maps.json'
+DEFAULT_BASEMAP_URL = 'https://basemaps.cartocdn.com/light_all/{z}/{x}/{y}.png'
+
+TILE_SIZE = 256
+# Same width as the <img> in the email's weather section
+DEFAULT_SIZE = (750, 450)
+HEADERS = {'User-Agent': 'DailyDigest/1.0 (weather radar)'}
+# Required by the base map and radar tile licences
+ATTRIBUTION = '© OpenStreetMap contributors © CARTO · RainViewer'
+
+
+def geocode_city(city: str) -> Optional[Tuple[float, float]]:
+    """Look up (latitude, longitude) for a city name"""
+    response = http_client.get(GEOCODE_URL, params={'name': city, 'count': 1}, headers=HEADERS)
+    response.raise_for_status()
+    results = response.json().get('results') or []
+    if not results:
+        return None
+    return results[0]['latitude'], results[0]['longitude']
+
+
+def latest_radar_template() -> Optional[str]:
+    """URL template of the most recent radar frame ({z}/{x}/{y} placeholders)"""
+    response = http_client.get(RADAR_INDEX_URL, headers=HEADERS)
+    response.raise_for_status()
+    index = response.json()
+    frames = index.get('radar', {}).get('past') or []
+    if not frames:
+        return None
+    # 256px tiles, colour scheme 2, smoothed, snow shown separately
+    return f"{index['host']}{frames[-1]['path']}/256/{{z}}/{{x}}/{{y}}/2/1_1.png"
+
+
+def _to_world_pixels(lat: float, lon: float, zoom: int) -> Tuple[float, float]:
+    """Web Mercator projection to global pixel coordinates at a zoom level"""
+    scale = TILE_SIZE * (2 ** zoom)
+    x = (lon + 180.0) / 360.0 * scale
+    sin_lat = math.sin(math.radians(max(min(lat, 85.0511), -85.0511)))
+    y = (0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)) * scale
+    return x, y
+
+
+def _fetch_tile(url: str):
+    """Download one tile as an RGBA image, None if it can't be fetched"""
+    from PIL import Image
+
+    try:
+        response = http_client.get(url, headers=HEADERS)
+        if response.status_code != 200:
+            return None
+        return Image.open(io.BytesIO(response.content)).convert('RGBA')
+    except Exception:
+        return None
+
+
+def _draw_attribution(image, text: str = ATTRIBUTION):
+    """Write the tile credits in the bottom-right corner on a translucent box"""
+    from PIL import Image, ImageDraw, ImageFont
+
+    font = ImageFont.load_default()
+    overlay = Image.new('RGBA', image.size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    text_left, text_top, text_right, text_bottom = draw.textbbox((0, 0), text, font=font)
+    padding = 3
+    box_width = text_right - text_left + 2 * padding
+    box_height = text_bottom - text_top + 2 * padding
+    x, y = image.width - box_width, image.height - box_height
+    draw.rectangle((x, y, image.width, image.height), fill=(255, 255, 255, 180))
+    draw.text((x + padding - text_left, y + padding - text_top), text, font=font, fill=(51, 51, 51, 255))
+    image.alpha_composite(overlay)
+
+
+def render_radar_map(city: str, output_path: Path, zoom: int = 7,
+                     size: Tuple[int, int] = DEFAULT_SIZE,
+                     basemap_url: str = DEFAULT_BASEMAP_URL) -> bool:
+    """
+    Render the rain radar around a city straight from map tiles
+
+    Args:
+        city: City name to centre the map on
+        output_path: Where to save the PNG
+        zoom: Map zoom level (radar tiles go up to ~7)
+        size: (width, height) of the final image
+        basemap_url: Tile template for the background map
+
+    Returns:
+        bool: True if the image was written
+    """
+    from PIL import Image, ImageDraw
+
+    location = geocode_city(city)
+    if not location:
+        print(f"   ✗ Could not geocode {city}")
+        return False
+
+    radar_url = latest_radar_template()
+    if not radar_url:
+        print("   ✗ No radar frames available")
+        return False
+
+    width, height = size
+    center_x, center_y = _to_world_pixels(*location, zoom)
+    left, top = center_x - width / 2, center_y - height / 2
+
+    first_x, first_y = int(left // TILE_SIZE), int(top // TILE_SIZE)
+    last_x = int((left + width) // TILE_SIZE)
+    last_y = int((top + height) // TILE_SIZE)
+    max_tile = 2 ** zoom
+
+    # Download every base and radar tile at once over the pooled client
+    jobs: Dict[Tuple[str, int, int], str] = {}
+    for tile_x in range(first_x, last_x + 1):
+        for tile_y in range(first_y, last_y + 1):
+            if not 0 <= tile_y < max_tile:
+                continue
+            wrapped_x = tile_x % max_tile
+            jobs[('base', tile_x, tile_y)] = basemap_url.format(z=zoom, x=wrapped_x, y=tile_y)
+            jobs[('radar', tile_x, tile_y)] = radar_url.format(z=zoom, x=wrapped_x, y=tile_y)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tiles = dict(zip(jobs, executor.map(_fetch_tile, jobs.values())))
+
+    if not any(image for (layer, _, _), image in tiles.items() if layer == 'base'):
+        print("   ✗ Base map tiles could not be downloaded")
+        return False
+
+    canvas_width = (last_x - first_x + 1) * TILE_SIZE
+    canvas_height = (last_y - first_y + 1) * TILE_SIZE
+    canvas = Image.new('RGBA', (canvas_width, canvas_height), (229, 227, 223, 255))
+
+    for layer in ('base', 'radar'):
+        for (tile_layer, tile_x, tile_y), image in tiles.items():
+            if tile_layer != layer or image is None:
+                continue
+            position = ((tile_x - first_x) * TILE_SIZE, (tile_y - first_y) * TILE_SIZE)
+            canvas.alpha_composite(image, dest=position)
+
+    offset_x = int(left - first_x * TILE_SIZE)
+    offset_y = int(top - first_y * TILE_SIZE)
+    image = canvas.crop((offset_x, offset_y, offset_x + width, offset_y + height))
+
+    # Mark the city in the middle of the map
+    draw = ImageDraw.Draw(image)
+    radius = 6
+    cx, cy = width // 2, height // 2
+    draw.ellipse((cx - radius, cy - radius, cx + radius, cy + radius),
+                 fill=(231, 76, 60, 255), outline=(255, 255, 255, 255), width=2)
+    _draw_attribution(image)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    image.convert('RGB').save(output_path, 'PNG', optimize=True)
+
+    size_kb = output_path.stat().st_size / 1024
+    print(f"   ✓ Radar map saved: {output_path.name} ({size_kb:.1f} KB)")
+    return True
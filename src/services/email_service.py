@@ -4,18 +4,81 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.image import MIMEImage
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+SMTP_HOST = 'smtp.gmail.com'
+# Note: Using port 465 (SSL). If execution fails, try port 587 with starttls.
+SMTP_PORT = 465
+# Reconnect after this many messages, Gmail drops long-lived sessions
+MAX_MESSAGES_PER_CONNECTION = 100
+
+
 class EmailService:
     def __init__(self):
         self.sender_email = os.getenv('SENDER_EMAIL')
         self.sender_password = os.getenv('SENDER_PASSWORD')  # App password!
         self.recipient_email = os.getenv('RECIPIENT_EMAIL')
+        # RECIPIENT_EMAIL may hold several comma separated addresses
+        self.recipient_emails = [
+            address.strip() for address in (self.recipient_email or '').split(',') if address.strip()
+        ]
+
+    def _build_message(self, recipient: str, subject: str, html_content: str,
+                       text_content: str = None, image_paths: dict = None, image_cache: dict = None):
+        """Build the MIME message, image bytes are read once per image_cache"""
+        # Create message container
+        message = MIMEMultipart('related')
+        message['From'] = self.sender_email
+        message['To'] = recipient
+        message['Subject'] = subject
+
+        # Create alternative container for text/html
+        msg_alternative = MIMEMultipart('alternative')
+        message.attach(msg_alternative)
+
+        # Add plain text version (fallback)
+        part_text = MIMEText(text_content or 'Please view this email in HTML mode.', 'plain')
+        msg_alternative.attach(part_text)
+
+        # Add HTML version
+        part_html = MIMEText(html_content, 'html')
+        msg_alternative.attach(part_html)
+
+        # Attach images if provided
+        if image_paths:
+            image_cache = {} if image_cache is None else image_cache
+            for image_name, image_path in image_paths.items():
+                if image_path not in image_cache:
+                    if not Path(image_path).exists():
+                        print(f"Image not found: {image_path}")
+                        continue
+                    with open(image_path, 'rb') as img_file:
+                        image_cache[image_path] = img_file.read()
+
+                image = MIMEImage(image_cache[image_path])
+                image.add_header('Content-ID', f'<{image_name}>')
+                image.add_header('Content-Disposition', 'inline', filename=Path(image_path).name)
+                message.attach(image)
 
-    def send_email(self, subject: str, html_content: str, text_content: str = None, image_paths: dict = None):
+        return message
+
+    def _connect(self):
+        """Open an authenticated SMTP session"""
+        server = smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT)
+        try:
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            # don't leak the TLS socket of a session we can't use
+            server.close()
+            raise
+        return server
+
+    def send_email(self, subject: str, html_content: str, text_content: str = None,
+                   image_paths: dict = None, recipient: str = None):
         """
         Send HTML email with optional embedded images
 
@@ -25,52 +88,20 @@ class EmailService:
             text_content: Plain text fallback (optional)
             image_paths: Dict of {image_name: file_path} for embedded images
                         Example: {'weather': 'src/imgs/morning_weather.png'}
+            recipient: Address to send to (defaults to RECIPIENT_EMAIL)
         """
+        recipient = recipient or self.recipient_email
         try:
-            # Create message container
-            message = MIMEMultipart('related')
-            message['From'] = self.sender_email
-            message['To'] = self.recipient_email
-            message['Subject'] = subject
-
-            # Create alternative container for text/html
-            msg_alternative = MIMEMultipart('alternative')
-            message.attach(msg_alternative)
-
-            # Add plain text version (fallback)
-            if text_content:
-                part_text = MIMEText(text_content, 'plain')
-                msg_alternative.attach(part_text)
-            else:
-                # Default fallback text
-                part_text = MIMEText('Please view this email in HTML mode.', 'plain')
-                msg_alternative.attach(part_text)
-
-            # Add HTML version
-            part_html = MIMEText(html_content, 'html')
-            msg_alternative.attach(part_html)
-
-            # Attach images if provided
-            if image_paths:
-                for image_name, image_path in image_paths.items():
-                    if Path(image_path).exists():
-                        with open(image_path, 'rb') as img_file:
-                            img_data = img_file.read()
-                            image = MIMEImage(img_data)
-                            image.add_header('Content-ID', f'<{image_name}>')
-                            image.add_header('Content-Disposition', 'inline', filename=Path(image_path).name)
-                            message.attach(image)
-                            print(f"Attached image: {image_name} ({Path(image_path).name})")
-                    else:
-                        print(f"Image not found: {image_path}")
+            message = self._build_message(recipient, subject, html_content, text_content, image_paths)
+            for image_name, image_path in (image_paths or {}).items():
+                if Path(image_path).exists():
+                    print(f"Attached image: {image_name} ({Path(image_path).name})")
 
             # Send via Gmail SMTP
-            # Note: Using port 465 (SSL). If execution fails, try port 587 with starttls.
-            with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-                server.login(self.sender_email, self.sender_password)
+            with self._connect() as server:
                 server.send_message(message)
 
-            print(f"Email sent to {self.recipient_email}")
+            print(f"Email sent to {recipient}")
             return True
 
         except Exception as e:
@@ -79,6 +110,138 @@ class EmailService:
             traceback.print_exc()
             return False
 
+    def _send_chunk(self, messages: list, image_cache: dict) -> list:
+        """Send messages in order over one connection, reconnecting when needed
+
+        If a connection can't be opened or logged into, the rest of the chunk
+        is reported as failed instead of retrying once per recipient, so bad
+        credentials cost one login attempt rather than one per message.
+        """
+        report = []
+        server = None
+        sent_on_connection = 0
+
+        try:
+            for index, item in enumerate(messages):
+                recipient = item['recipient']
+                try:
+                    message = self._build_message(
+                        recipient,
+                        item['subject'],
+                        item['html_content'],
+                        item.get('text_content'),
+                        item.get('image_paths'),
+                        image_cache
+                    )
+                except Exception as e:
+                    report.append({'recipient': recipient, 'success': False, 'error': str(e)})
+                    continue
+
+                # One retry on a fresh connection if the server hung up on us
+                error = None
+                connect_error = None
+                for attempt in range(2):
+                    if server is None or sent_on_connection >= MAX_MESSAGES_PER_CONNECTION:
+                        if server is not None:
+                            try:
+                                server.quit()
+                            except Exception:
+                                pass
+                        try:
+                            server = self._connect()
+                        except (smtplib.SMTPException, OSError) as e:
+                            # login refused or server unreachable, the next message would fare no better
+                            server = None
+                            connect_error = e
+                            break
+                        sent_on_connection = 0
+
+                    try:
+                        server.send_message(message)
+                        sent_on_connection += 1
+                        error = None
+                        break
+
+                    except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError) as e:
+                        error = e
+                        server = None
+                    except smtplib.SMTPException as e:
+                        # refused recipient or similar, the connection is still fine
+                        error = e
+                        break
+                    except OSError as e:
+                        # socket / TLS failure, the connection is gone
+                        error = e
+                        server = None
+                    except Exception as e:
+                        error = e
+                        break
+
+                if connect_error is not None:
+                    print(f"Could not connect to {SMTP_HOST}: {connect_error}")
+                    report.extend(
+                        {'recipient': rest['recipient'], 'success': False, 'error': str(connect_error)}
+                        for rest in messages[index:]
+                    )
+                    break
+
+                report.append({
+                    'recipient': recipient,
+                    'success': error is None,
+                    'error': str(error) if error else None
+                })
+
+        finally:
+            if server is not None:
+                try:
+                    server.quit()
+                except Exception:
+                    pass
+
+        return report
+
+    def send_batch(self, messages, pool_size: int = 1) -> list:
+        """
+        Send many personalized emails over a few reused SMTP connections
+
+        Args:
+            messages: Iterable of dicts with 'recipient', 'subject', 'html_content'
+                      and optional 'text_content' / 'image_paths'
+            pool_size: Number of parallel SMTP connections
+
+        Returns:
+            List of {'recipient', 'success', 'error'} in the same order as messages
+        """
+        messages = list(messages)
+        if not messages:
+            return []
+
+        # Shared images (e.g. the weather map) are read from disk only once
+        image_cache = {}
+        pool_size = max(1, min(pool_size, len(messages)))
+        # Interleave so every connection gets a similar share
+        chunks = [messages[i::pool_size] for i in range(pool_size)]
+
+        if pool_size == 1:
+            chunk_reports = [self._send_chunk(messages, image_cache)]
+        else:
+            with ThreadPoolExecutor(max_workers=pool_size) as executor:
+                chunk_reports = list(executor.map(lambda chunk: self._send_chunk(chunk, image_cache), chunks))
+
+        # Undo the interleaving
+        report = [None] * len(messages)
+        for offset, chunk_report in enumerate(chunk_reports):
+            for index, entry in enumerate(chunk_report):
+                report[offset + index * pool_size] = entry
+
+        sent = sum(1 for entry in report if entry['success'])
+        print(f"Batch delivery: {sent}/{len(report)} emails sent")
+        for entry in report:
+            if not entry['success']:
+                print(f"   Failed for {entry['recipient']}: {entry['error']}")
+
+        return report
+
 
 # Test example
 if __name__ == "__main__":
@@ -1,66 +1,33 @@
+import io
 from datetime import datetime
 
+# Most stories shown per news section (and in the finance section)
+NEWS_SECTION_LIMIT = 10
+FINANCE_NEWS_LIMIT = 5
 
-def build_email_html(
-        web_scrapper=None,
-        tech_news=None,
-        sports_news=None,
-        science_news=None,
-        entertainment_news=None,
-        finance_news=None,
-        crypto_data=None,
-        exchange_rates=None,
-        has_weather_screenshot=False
-):
-    """
-    Build comprehensive HTML email from all data sources
-
-    Args:
-        web_scrapper: List of (source, title, link) - World news
-        tech_news: List of (source, title, link) - Tech news
-        sports_news: List of (source, title, link) - Sports news
-        science_news: List of (source, title, link) - Science news
-        entertainment_news: List of (source, title, link) - Entertainment news
-        finance_news: List of (source, title, link) - Finance news
-        crypto_data: Dict of crypto prices
-        exchange_rates: Dict of exchange rates
-        has_weather_screenshot: Bool - whether weather screenshot exists
-    """
-
-    # Default empty lists/dicts if None
-    web_scrapper = web_scrapper or []
-    tech_news = tech_news or []
-    sports_news = sports_news or []
-    science_news = science_news or []
-    entertainment_news = entertainment_news or []
-    finance_news = finance_news or []
-    crypto_data = crypto_data or {}
-    exchange_rates = exchange_rates or {}
-
-    # Get current date
-    current_date = datetime.now().strftime('%B %d, %Y')
 
-    html = f"""
+# Static document skeleton: parsed once at import, only the slots change per call
+_SKELETON_TEMPLATE = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <style>
-            * {{
+            * {
                 margin: 0;
                 padding: 0;
                 box-sizing: border-box;
-            }}
+            }
 
-            body {{
+            body {
                 font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
                 background-color: #f4f6f8;
                 padding: 20px;
                 line-height: 1.6;
-            }}
+            }
 
-            .container {{
+            .container {
                 max-width: 800px;
                 margin: 0 auto;
                 background-color: #ffffff;
@@ -68,39 +35,39 @@ def build_email_html(
                 box-shadow: 0 4px 6px rgba(0,0,0,0.05);
                 overflow: hidden;
                 border: 1px solid #e1e4e8;
-            }}
+            }
 
-            .header {{
+            .header {
                 background-color: #2c3e50;
                 color: white;
                 padding: 30px 30px;
                 text-align: center;
                 border-bottom: 4px solid #3498db;
-            }}
+            }
 
-            .header h1 {{
+            .header h1 {
                 font-size: 28px;
                 margin-bottom: 5px;
                 font-weight: 600;
                 letter-spacing: 0.5px;
-            }}
+            }
 
-            .header .date {{
+            .header .date {
                 font-size: 14px;
                 opacity: 0.8;
                 text-transform: uppercase;
                 letter-spacing: 1px;
-            }}
+            }
 
-            .content {{
+            .content {
                 padding: 30px;
-            }}
+            }
 
-            .section {{
+            .section {
                 margin-bottom: 40px;
-            }}
+            }
 
-            .section-title {{
+            .section-title {
                 font-size: 20px;
                 color: #2c3e50;
                 margin-bottom: 20px;
@@ -111,31 +78,31 @@ def build_email_html(
                 gap: 10px;
                 text-transform: uppercase;
                 letter-spacing: 0.5px;
-            }}
+            }
 
             /* Weather styles */
-            .weather-screenshot {{
+            .weather-screenshot {
                 margin-top: 15px;
                 text-align: center;
-            }}
+            }
 
-            .weather-screenshot img {{
+            .weather-screenshot img {
                 width: 100%;
                 max-width: 750px;
                 border-radius: 4px;
                 border: 1px solid #ddd;
                 display: block;
                 margin: 0 auto;
-            }}
+            }
 
             /* Finance styles */
-            .finance-grid {{
+            .finance-grid {
                 display: grid;
                 gap: 15px;
                 margin-top: 15px;
-            }}
+            }
 
-            .crypto-item {{
+            .crypto-item {
                 background-color: #f8f9fa;
                 padding: 12px 15px;
                 border-radius: 4px;
@@ -143,81 +110,87 @@ def build_email_html(
                 justify-content: space-between;
                 align-items: center;
                 border: 1px solid #e9ecef;
-            }}
+            }
 
-            .crypto-name {{
+            .crypto-name {
                 font-weight: 600;
                 color: #2c3e50;
                 font-size: 15px;
-            }}
+            }
 
-            .crypto-price {{
+            .crypto-price {
                 font-size: 16px;
                 font-weight: 700;
                 color: #2c3e50;
-            }}
+            }
 
-            .crypto-change {{
+            .crypto-change {
                 font-size: 13px;
                 margin-left: 10px;
                 font-weight: 500;
-            }}
+            }
 
-            .crypto-change.positive {{
+            .crypto-change.positive {
                 color: #27ae60;
-            }}
+            }
 
-            .crypto-change.negative {{
+            .crypto-change.negative {
                 color: #c0392b;
-            }}
+            }
 
-            .exchange-grid {{
+            .crypto-trend {
+                font-size: 12px;
+                color: #7f8c8d;
+                letter-spacing: 1px;
+            }
+
+            .exchange-grid {
                 display: grid;
                 grid-template-columns: repeat(auto-fill, minmax(150px, 1fr));
                 gap: 10px;
                 margin-top: 15px;
-            }}
+            }
 
-            .exchange-item {{
+            .exchange-item {
                 background-color: #fff;
                 padding: 10px;
                 border-radius: 4px;
                 text-align: center;
                 border: 1px solid #dfe6e9;
-            }}
+            }
 
-            .exchange-pair {{
+            .exchange-pair {
                 font-size: 11px;
                 color: #7f8c8d;
                 text-transform: uppercase;
                 margin-bottom: 2px;
-            }}
+            }
 
-            .exchange-rate {{
+            .exchange-rate {
                 font-size: 16px;
                 font-weight: 600;
                 color: #2c3e50;
-            }}
+            }
 
             /* News styles */
-            .news-list {{
+            .news-list {
                 list-style: none;
-            }}
+            }
 
-            .news-item {{
+            .news-item {
                 margin-bottom: 12px;
                 padding: 12px;
                 background-color: #fff;
                 border: 1px solid #e1e4e8;
                 border-radius: 4px;
                 transition: background-color 0.2s;
-            }}
+            }
 
-            .news-item:hover {{
+            .news-item:hover {
                 background-color: #f1f2f6;
-            }}
+            }
 
-            .news-source {{
+            .news-source {
                 display: inline-block;
                 background-color: #34495e;
                 color: white;
@@ -227,43 +200,43 @@ def build_email_html(
                 font-weight: bold;
                 margin-bottom: 5px;
                 text-transform: uppercase;
-            }}
+            }
 
-            .news-title {{
+            .news-title {
                 color: #2980b9;
                 text-decoration: none;
                 font-size: 15px;
                 font-weight: 500;
                 display: block;
                 line-height: 1.4;
-            }}
+            }
 
-            .news-title:hover {{
+            .news-title:hover {
                 text-decoration: underline;
                 color: #1a5276;
-            }}
+            }
 
             /* Footer */
-            .footer {{
+            .footer {
                 background-color: #f8f9fa;
                 padding: 20px;
                 text-align: center;
                 border-top: 1px solid #e9ecef;
-            }}
+            }
 
-            .footer p {{
+            .footer p {
                 color: #7f8c8d;
                 font-size: 12px;
-            }}
+            }
 
             /* Empty state */
-            .empty-state {{
+            .empty-state {
                 text-align: center;
                 padding: 20px;
                 color: #95a5a6;
                 font-style: italic;
                 font-size: 14px;
-            }}
+            }
         </style>
     </head>
     <body>
@@ -271,30 +244,11 @@ def build_email_html(
             <!-- Header -->
             <div class="header">
                 <h1>Daily Digest</h1>
-                <p class="date">{current_date}</p>
+                <p class="date"><!--slot:date--></p>
             </div>
 
             <div class="content">
-                <!-- Weather Screenshot Section -->
-                {_build_weather_section(has_weather_screenshot)}
-
-                <!-- Finance Section -->
-                {_build_finance_section(crypto_data, exchange_rates, finance_news)}
-
-                <!-- World News Section -->
-                {_build_news_section("World News", web_scrapper)}
-
-                <!-- Tech News Section -->
-                {_build_news_section("Technology", tech_news)}
-
-                <!-- Sports Section -->
-                {_build_news_section("Sports", sports_news)}
-
-                <!-- Science Section -->
-                {_build_news_section("Science", science_news)}
-
-                <!-- Entertainment Section -->
-                {_build_news_section("Entertainment", entertainment_news)}
+                <!--slot:content-->
             </div>
 
             <!-- Footer -->
@@ -306,37 +260,165 @@ def build_email_html(
     </html>
     """
 
-    return html
+
+def _split_skeleton(template):
+    """Split the skeleton into the static chunks around its slots"""
+    head, rest = template.split('<!--slot:date-->')
+    after_date, tail = rest.split('<!--slot:content-->')
+    return head, after_date, tail
 
 
-def _build_weather_section(has_screenshot):
-    """Build weather section HTML - only shows screenshot if available"""
-    if not has_screenshot:
-        return ""
+_SKELETON_HEAD, _SKELETON_AFTER_DATE, _SKELETON_TAIL = _split_skeleton(_SKELETON_TEMPLATE)
 
-    return """
-    <div class="section">
-        <h2 class="section-title">Weather Radar</h2>
+
+def iter_email_html(
+        web_scrapper=None,
+        tech_news=None,
+        sports_news=None,
+        science_news=None,
+        entertainment_news=None,
+        finance_news=None,
+        crypto_data=None,
+        exchange_rates=None,
+        has_weather_screenshot=False,
+        weather_images=None,
+        money_as_of=None
+):
+    """
+    Render the HTML email as a stream of fragments, in document order
+
+    Args:
+        web_scrapper: List of (source, title, link) - World news
+        tech_news: List of (source, title, link) - Tech news
+        sports_news: List of (source, title, link) - Sports news
+        science_news: List of (source, title, link) - Science news
+        entertainment_news: List of (source, title, link) - Entertainment news
+        finance_news: List of (source, title, link) - Finance news
+        crypto_data: Dict of crypto prices
+        exchange_rates: Dict of exchange rates
+        has_weather_screenshot: Bool - whether weather screenshot exists
+        weather_images: List of (city, content_id) - one radar image per city
+        money_as_of: Dict of {'crypto_data' / 'exchange_rates': datetime} - sections
+            served from an older snapshot, labelled "as of <date>"
+
+    Yields: str fragments of the document
+    """
+
+    # Default empty lists/dicts if None
+    web_scrapper = web_scrapper or []
+    tech_news = tech_news or []
+    sports_news = sports_news or []
+    science_news = science_news or []
+    entertainment_news = entertainment_news or []
+    finance_news = finance_news or []
+    crypto_data = crypto_data or {}
+    exchange_rates = exchange_rates or {}
+
+    # Get current date
+    current_date = datetime.now().strftime('%B %d, %Y')
+
+    yield _SKELETON_HEAD
+    yield current_date
+    yield _SKELETON_AFTER_DATE
+
+    yield from _iter_weather_section(has_weather_screenshot, weather_images)
+    yield from _iter_finance_section(crypto_data, exchange_rates, finance_news, money_as_of or {})
+
+    for section_title, news_list in [
+        ("World News", web_scrapper),
+        ("Technology", tech_news),
+        ("Sports", sports_news),
+        ("Science", science_news),
+        ("Entertainment", entertainment_news),
+    ]:
+        yield from _iter_news_section(section_title, news_list)
+
+    yield _SKELETON_TAIL
+
+
+def write_email_html(out, **data):
+    """Stream the HTML email into any writable text object (file, io.StringIO, ...)
+    Takes the same keyword arguments as iter_email_html
+    """
+    for fragment in iter_email_html(**data):
+        out.write(fragment)
+
+
+def build_email_html(**data):
+    """Build comprehensive HTML email from all data sources
+    Takes the same keyword arguments as iter_email_html
+    """
+    buffer = io.StringIO()
+    write_email_html(buffer, **data)
+    return buffer.getvalue()
+
+
+def _iter_weather_section(has_screenshot, weather_images=None):
+    """Weather section fragments - only shows screenshots if available"""
+    if not weather_images:
+        if not has_screenshot:
+            return
+        # single capture embedded under the original Content-ID
+        weather_images = [(None, 'weather_map')]
+
+    yield '<div class="section"><h2 class="section-title">Weather Radar</h2>'
+
+    for city, content_id in weather_images:
+        if city and len(weather_images) > 1:
+            yield f'<h3 style="margin: 15px 0 10px 0; color: #2c3e50; font-size: 16px;">{city}</h3>'
+        alt = f"Weather Radar Map - {city}" if city else "Weather Radar Map"
+
+        yield f"""
         <div style="margin-top: 15px;">
-            <img src="cid:weather_map" alt="Weather Radar Map" 
+            <img src="cid:{content_id}" alt="{alt}" 
                  style="width: 100%; max-width: 750px; border-radius: 4px; 
                         border: 1px solid #ddd; display: block; margin: 0 auto;">
         </div>
-    </div>
-    """
+        """
+
+    yield '</div>'
+
+
+# Symbols for common quote currencies, others are shown by their code
+CURRENCY_SYMBOLS = {'usd': '$', 'eur': '€', 'gbp': '£', 'jpy': '¥', 'cny': '¥', 'inr': '₹', 'brl': 'R$', 'btc': '₿'}
+
+
+def _format_price(price, currency) -> str:
+    """Price in its quote currency: $1,234.50, R$10.00, CHF 3.20"""
+    symbol = CURRENCY_SYMBOLS.get(currency.lower())
+    if symbol:
+        return f'{symbol}{price:,.2f}'
+    return f'{currency.upper()} {price:,.2f}'
+
 
+def _as_of(as_of, section) -> str:
+    """" (as of Oct 17, 09:30)" after a section title when its data is an older snapshot"""
+    if not as_of or not as_of.get(section):
+        return ''
+    return (f' <span style="font-size: 12px; font-weight: normal; color: #c0392b;">'
+            f'(as of {as_of[section].strftime("%b %d, %H:%M")})</span>')
 
-def _build_finance_section(crypto_data, exchange_rates, finance_news):
-    """Build finance section HTML"""
+
+def _sparkline(values) -> str:
+    """Text sparkline (▁▂▃▄▅▆▇█) of a price series, renders in any mail client"""
+    bars = '▁▂▃▄▅▆▇█'
+    low, high = min(values), max(values)
+    if high == low:
+        return bars[3] * len(values)
+    return ''.join(bars[round((value - low) / (high - low) * (len(bars) - 1))] for value in values)
+
+
+def _iter_finance_section(crypto_data, exchange_rates, finance_news, as_of=None):
+    """Finance section fragments"""
     if not crypto_data and not exchange_rates and not finance_news:
-        return ""
+        return
 
-    html = '<div class="section"><h2 class="section-title">Finance</h2>'
+    yield '<div class="section"><h2 class="section-title">Finance</h2>'
 
     # Crypto prices
     if crypto_data:
-        html += '<h3 style="margin: 15px 0 10px 0; color: #2c3e50; font-size: 16px;">Cryptocurrency</h3>'
-        html += '<div class="finance-grid">'
+        yield f'<h3 style="margin: 15px 0 10px 0; color: #2c3e50; font-size: 16px;">Cryptocurrency{_as_of(as_of, "crypto_data")}</h3>'
+        yield '<div class="finance-grid">'
 
         for crypto_name, info in crypto_data.items():
             price = info.get('price', 0)
@@ -344,78 +426,83 @@ def _build_finance_section(crypto_data, exchange_rates, finance_news):
             change_class = 'positive' if change >= 0 else 'negative'
             arrow = '▲' if change >= 0 else '▼'
 
-            html += f"""
+            # Week-over-week figures, only once the market history has them
+            trend = ''
+            if info.get('trend'):
+                trend = f'<div class="crypto-trend">{_sparkline(info["trend"])} 7d</div>'
+            weekly = ''
+            if info.get('change_7d') is not None:
+                change_7d = info['change_7d']
+                weekly = (f'<span class="crypto-change {"positive" if change_7d >= 0 else "negative"}">'
+                          f'{"▲" if change_7d >= 0 else "▼"} {abs(change_7d):.2f}% 7d</span>')
+
+            yield f"""
             <div class="crypto-item">
                 <div>
                     <div class="crypto-name">{crypto_name}</div>
+                    {trend}
                 </div>
                 <div style="text-align: right;">
-                    <span class="crypto-price">${price:,.2f}</span>
+                    <span class="crypto-price">{_format_price(price, info.get('currency', 'usd'))}</span>
                     <span class="crypto-change {change_class}">{arrow} {abs(change):.2f}%</span>
+                    {weekly}
                 </div>
             </div>
             """
 
-        html += '</div>'
+        yield '</div>'
 
     # Exchange rates
     if exchange_rates:
-        html += '<h3 style="margin: 15px 0 10px 0; color: #2c3e50; font-size: 16px;">Exchange Rates</h3>'
-        html += '<div class="exchange-grid">'
+        yield f'<h3 style="margin: 15px 0 10px 0; color: #2c3e50; font-size: 16px;">Exchange Rates{_as_of(as_of, "exchange_rates")}</h3>'
+        yield '<div class="exchange-grid">'
 
         for pair, rate in exchange_rates.items():
-            html += f"""
+            yield f"""
             <div class="exchange-item">
                 <div class="exchange-pair">{pair}</div>
                 <div class="exchange-rate">{rate}</div>
             </div>
             """
 
-        html += '</div>'
+        yield '</div>'
 
     # Finance news
     if finance_news:
-        html += '<h3 style="margin: 15px 0 10px 0; color: #2c3e50; font-size: 16px;">Financial News</h3>'
-        html += '<ul class="news-list">'
+        yield '<h3 style="margin: 15px 0 10px 0; color: #2c3e50; font-size: 16px;">Financial News</h3>'
+        yield '<ul class="news-list">'
 
-        for source, title, link in finance_news[:5]:
-            html += f"""
+        for source, title, link in finance_news[:FINANCE_NEWS_LIMIT]:
+            yield f"""
             <li class="news-item">
                 <span class="news-source">{source}</span>
                 <a href="{link}" class="news-title" target="_blank">{title}</a>
             </li>
             """
 
-        html += '</ul>'
+        yield '</ul>'
 
-    html += '</div>'
-    return html
+    yield '</div>'
 
 
-def _build_news_section(section_title, news_list):
-    """Build a news section HTML"""
+def _iter_news_section(section_title, news_list):
+    """News section fragments"""
     if not news_list:
-        return ""
+        return
 
-    html = f'<div class="section"><h2 class="section-title">{section_title}</h2>'
+    yield f'<div class="section"><h2 class="section-title">{section_title}</h2>'
+    yield '<ul class="news-list">'
 
-    if len(news_list) == 0:
-        html += '<div class="empty-state">No news available</div>'
-    else:
-        html += '<ul class="news-list">'
-
-        for source, title, link in news_list[:10]:  # Limit to 10 items per section
-            html += f"""
+    for source, title, link in news_list[:NEWS_SECTION_LIMIT]:
+        yield f"""
             <li class="news-item">
                 <span class="news-source">{source}</span>
                 <a href="{link}" class="news-title" target="_blank">{title}</a>
             </li>
             """
 
-        html += '</ul>'
-
-    html += '</div>'
-    return html
+    yield '</ul>'
+    yield '</div>'
 
 
 # Test function
@@ -444,11 +531,9 @@ if __name__ == "__main__":
         'has_weather_screenshot': True  # Set to True to test weather section
     }
 
-    html_output = build_email_html(**test_data)
-
-    # Save to file for testing
+    # Stream straight to file for testing
     with open('test_email.html', 'w', encoding='utf-8') as f:
-        f.write(html_output)
+        write_email_html(f, **test_data)
 
     print("Test email HTML generated successfully!")
     print("Open 'test_email.html' in your browser to preview")
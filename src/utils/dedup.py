@@ -0,0 +1,153 @@
+import re
+import random
+import hashlib
+from typing import Dict, List, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'igshid',
+    'ref', 'ref_src', 'ref_url', 'cmpid', 'ocid', 'smid', 'smtyp', 'ito',
+    'src', 'source', 'CMP', 'taid', 'guccounter', 'ncid', 'sr_share',
+}
+TRACKING_PREFIXES = ('utm_', 'at_', 'mkt_', 'pk_')
+HOST_PREFIXES = ('www.', 'm.', 'mobile.', 'amp.', 'edition.')
+
+# MinHash / LSH settings, the band split follows the threshold (see lsh_rows)
+NUM_PERM = 64
+# Chance that a pair right at the threshold shares at least one bucket
+MIN_RECALL = 0.999
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1337)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+                 for _ in range(NUM_PERM)]
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a story URL: bare host, no tracking params, no fragment"""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+
+    host = (parts.hostname or '').lower()
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+
+    path = re.sub(r'/(amp|index\.html?)$', '', parts.path).rstrip('/') or '/'
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    # http and https are the same story
+    return urlunsplit(('', host, path, urlencode(query), ''))
+
+
+def title_shingles(title: str) -> Set[str]:
+    """Word bigrams of a normalized headline (single words for one-word titles)"""
+    words = re.findall(r'\w+', title.lower())
+    if len(words) < 2:
+        return set(words)
+    return {f'{a} {b}' for a, b in zip(words, words[1:])}
+
+
+def _minhash(shingles: Set[str]) -> List[int]:
+    hashes = [int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'big')
+              for s in shingles]
+    return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def lsh_rows(threshold: float, num_perm: int = NUM_PERM, min_recall: float = MIN_RECALL) -> int:
+    """Rows per LSH band for a Jaccard threshold
+
+    A pair with similarity s shares a bucket with probability
+    1 - (1 - s**rows)**bands. The widest bands (fewest false candidates)
+    that still catch a pair at the threshold `min_recall` of the time win.
+    """
+    best = 1
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if 1 - (1 - max(threshold, 0.0) ** rows) ** bands >= min_recall:
+            best = rows
+    return best
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class DedupIndex:
+    """Remembers stories seen so far and spots repeats by URL or near-identical title
+
+    Titles are MinHashed into LSH buckets, so each lookup only compares
+    against the few stories sharing a bucket: close to linear overall.
+    The bands are sized from the threshold, so lower thresholds still find
+    their pairs, at the cost of more candidates to compare.
+    """
+
+    def __init__(self, threshold: float = 0.5):
+        self.threshold = threshold
+        self.rows = lsh_rows(threshold)
+        self.bands = NUM_PERM // self.rows
+        self._urls: Set[str] = set()
+        self._shingles: List[Set[str]] = []
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+
+    def _band_keys(self, signature: List[int]):
+        for band in range(self.bands):
+            yield band, tuple(signature[band * self.rows:(band + 1) * self.rows])
+
+    def add(self, title: str, link: str) -> bool:
+        """Record a story, False if it duplicates one already seen"""
+        url_key = normalize_url(link) if link else None
+        if url_key and url_key in self._urls:
+            return False
+
+        shingles = title_shingles(title)
+        signature = _minhash(shingles) if shingles else None
+
+        if signature:
+            candidates = set()
+            for key in self._band_keys(signature):
+                candidates.update(self._buckets.get(key, ()))
+            if any(_jaccard(shingles, self._shingles[i]) >= self.threshold for i in candidates):
+                return False
+
+        if url_key:
+            self._urls.add(url_key)
+        if signature:
+            index = len(self._shingles)
+            self._shingles.append(shingles)
+            for key in self._band_keys(signature):
+                self._buckets.setdefault(key, []).append(index)
+        return True
+
+
+def dedupe_sections(data: Dict, section_keys: List[str], threshold: float = 0.5) -> Dict:
+    """Drop repeated stories across news sections, keeping the first occurrence
+
+    Sections are walked in `section_keys` order (the order they are rendered).
+    Returns: a copy of data with the filtered (source, title, link) lists
+    """
+    index = DedupIndex(threshold)
+    deduped = dict(data)
+    removed = 0
+
+    for key in section_keys:
+        kept = []
+        for source, title, link in data.get(key) or []:
+            if index.add(title, link):
+                kept.append((source, title, link))
+            else:
+                removed += 1
+        deduped[key] = kept
+
+    if removed:
+        print(f"   Removed {removed} duplicate stories")
+    return deduped
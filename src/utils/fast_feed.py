@@ -0,0 +1,92 @@
+import xml.etree.ElementTree as ET
+from typing import List, Optional, Tuple
+
+# Namespaces whose <item>/<entry>, <title> and <link> we understand
+# (plain RSS 2.0, Atom and RSS 1.0 / RDF)
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+FEED_NAMESPACES = ('', ATOM_NS, 'http://purl.org/rss/1.0/')
+ENTRY_TAGS = ('item', 'entry')
+
+
+def _split_tag(tag: str) -> Tuple[str, str]:
+    """'{namespace}name' -> (namespace, name)"""
+    if tag.startswith('{'):
+        namespace, _, name = tag[1:].partition('}')
+        return namespace, name
+    return '', tag
+
+
+class FeedEntryReader:
+    """Incremental RSS/Atom reader that keeps only each entry's title and link
+
+    Bytes are fed as they arrive and parsing stops as soon as `limit`
+    entries are complete, so the rest of the document is never parsed
+    (or even downloaded). Raises xml.etree.ElementTree.ParseError on
+    malformed XML, callers fall back to feedparser for those feeds.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.entries: List[Tuple[str, str]] = []
+        self._parser = ET.XMLPullParser(events=('start', 'end'))
+        self._stack: List[str] = []
+        self._title: Optional[str] = None
+        self._link: Optional[str] = None
+        self._link_is_html = False
+
+    @property
+    def done(self) -> bool:
+        return len(self.entries) >= self.limit
+
+    def feed(self, chunk: bytes) -> bool:
+        """Parse another chunk, True once enough entries were read"""
+        if self.done:
+            return True
+        self._parser.feed(chunk)
+        self._process_events()
+        return self.done
+
+    def close(self) -> List[Tuple[str, str]]:
+        """Finish parsing a fully downloaded document"""
+        if not self.done:
+            self._parser.close()
+            self._process_events()
+        return self.entries
+
+    def _in_entry(self) -> bool:
+        # the element just closed is a direct child of an item/entry
+        return len(self._stack) >= 2 and self._stack[-2] in ENTRY_TAGS
+
+    def _process_events(self):
+        for event, element in self._parser.read_events():
+            namespace, name = _split_tag(element.tag)
+            known = namespace in FEED_NAMESPACES
+            local = name if known else f'{namespace}:{name}'
+
+            if event == 'start':
+                self._stack.append(local)
+                if local in ENTRY_TAGS:
+                    self._title, self._link, self._link_is_html = None, None, False
+                continue
+
+            if local == 'title' and self._in_entry() and self._title is None:
+                self._title = ''.join(element.itertext()).strip()
+
+            elif local == 'link' and self._in_entry():
+                if namespace == ATOM_NS:
+                    rel = element.get('rel', 'alternate')
+                    if rel == 'alternate' and element.get('href'):
+                        # first alternate wins, unless a later one is the HTML page
+                        is_html = element.get('type', 'text/html') == 'text/html'
+                        if self._link is None or (is_html and not self._link_is_html):
+                            self._link, self._link_is_html = element.get('href'), is_html
+                elif self._link is None:
+                    self._link = (element.text or '').strip() or element.get('href')
+
+            elif local in ENTRY_TAGS:
+                self.entries.append((self._title or "No title", self._link or ""))
+                element.clear()
+
+            self._stack.pop()
+            if self.done:
+                return
@@ -0,0 +1,104 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+cache_dir = Path(__file__).parent.parent / 'cache'
+
+# Keep enough entries for any per-feed limit without bloating the file
+MAX_CACHED_ENTRIES = 50
+
+
+def cap_entries(entries: List[Tuple[str, str]],
+                depth: Optional[int]) -> Tuple[List[Tuple[str, str]], Optional[int]]:
+    """Trim entries to MAX_CACHED_ENTRIES, lowering the recorded depth to match"""
+    if len(entries) > MAX_CACHED_ENTRIES:
+        return entries[:MAX_CACHED_ENTRIES], MAX_CACHED_ENTRIES
+    return entries, depth
+
+
+def covers(entries: List, depth: Optional[int], limit: int) -> bool:
+    """Whether entries read `depth` deep (None: the whole feed) can serve `limit` of them
+
+    A read that returned fewer entries than it asked for hit the end of the feed.
+    """
+    return depth is None or depth >= limit or len(entries) < depth
+
+
+class FeedValidatorCache:
+    """On-disk ETag / Last-Modified cache with the parsed entries per feed URL"""
+
+    def __init__(self, path: Path = cache_dir / 'feed_validators.json'):
+        self.path = Path(path)
+        self._feeds: Optional[Dict[str, Dict]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict]:
+        if self._feeds is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._feeds = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._feeds = {}
+        return self._feeds
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for a feed"""
+        cached = self._load().get(url)
+        if not cached:
+            return {}
+
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+
+    def entries(self, url: str) -> Optional[Tuple[List[Tuple[str, str]], Optional[int]]]:
+        """Previously parsed (title, link) entries and how deep they were read
+        (None: the whole feed), None if never cached
+        """
+        cached = self._load().get(url)
+        if cached is None:
+            return None
+        entries = [tuple(entry) for entry in cached.get('entries', [])]
+        # files written before depths were stored: assume nothing past what's there
+        return entries, cached.get('depth', len(entries))
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str],
+              entries: List[Tuple[str, str]], depth: Optional[int] = None):
+        """Remember the validators and entries of a freshly downloaded feed
+        `depth` is how many entries the read asked for, None for the whole feed
+        """
+        feeds = self._load()
+        if not etag and not last_modified:
+            # nothing to revalidate with next time
+            if feeds.pop(url, None) is not None:
+                self._dirty = True
+            return
+
+        entries, depth = cap_entries(entries, depth)
+        feeds[url] = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'entries': [list(entry) for entry in entries],
+            'depth': depth,
+        }
+        self._dirty = True
+
+    def save(self):
+        """Write the cache to disk if anything changed"""
+        if not self._dirty:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._feeds, f, ensure_ascii=False)
+            # atomic swap so a concurrent run never reads half a file
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            print(f"Error saving feed cache: {e}")
@@ -0,0 +1,200 @@
+import json
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import xml.etree.ElementTree as ET
+import aiohttp
+import feedparser
+
+from src.utils.fast_feed import FeedEntryReader
+from src.utils.feed_cache import FeedValidatorCache, cap_entries, covers
+from src.utils.result_cache import ResultCache
+
+#load config with proper path
+config_path = Path(__file__).parent.parent / 'configs' / 'config.json'
+
+try:
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config_data = json.load(f)
+except FileNotFoundError:
+    print(f'config.json not found at {config_path}')
+    config_data = {}
+
+cache_config = config_data.get('feeds', {}).get('cache', {})
+# "fast" reads only the entries we show, "feedparser" does a full parse
+FAST_PARSER = config_data.get('feeds', {}).get('parser', 'fast') == 'fast'
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; DailyDigest/1.0)'
+}
+
+# Session shared by every fetch inside a feed_session() block
+_current_session: ContextVar = ContextVar('feed_session', default=None)
+# Validator cache used for conditional GETs inside a feed_session() block
+_current_cache: ContextVar = ContextVar('feed_cache', default=None)
+
+validator_cache = FeedValidatorCache()
+
+# Parsed entries shared across runs and processes, fresh for cache_config['ttl'] seconds
+result_cache = ResultCache(max_entries=cache_config.get('max_entries', 500))
+CACHE_ENABLED = cache_config.get('enabled', True)
+DEFAULT_TTL = cache_config.get('ttl', 1800) if CACHE_ENABLED else 0
+
+# Entries of every feed fetched in this run, so a feed shared by several
+# categories or subscribers is downloaded once and fanned out from memory
+_run_memo: Dict[str, Tuple[List[Tuple[str, str]], Optional[int]]] = {}
+
+
+def clear_run_memo():
+    """Forget the feeds fetched so far (call at the start of a new run)"""
+    _run_memo.clear()
+
+
+@asynccontextmanager
+async def feed_session(max_connections: int = 20, per_host: int = 4, timeout: float = 15,
+                       conditional_get: bool = True):
+    """Open a pooled HTTP session used by every fetch_rss call inside the block
+
+    With conditional_get, feeds are revalidated with ETag / Last-Modified and
+    the validator cache is written back to disk when the block exits.
+    """
+    connector = aiohttp.TCPConnector(limit=max_connections, limit_per_host=per_host)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout,
+                                     headers=DEFAULT_HEADERS) as session:
+        session_token = _current_session.set(session)
+        cache_token = _current_cache.set(validator_cache if conditional_get else None)
+        try:
+            yield session
+        finally:
+            _current_cache.reset(cache_token)
+            _current_session.reset(session_token)
+            if conditional_get:
+                validator_cache.save()
+
+
+def _parse_entries(data: bytes) -> List[Tuple[str, str]]:
+    """Parse feed bytes into (title, link) entries"""
+    feed = feedparser.parse(data)
+    return [(entry.get("title", "No title"), entry.get("link", "")) for entry in feed.entries]
+
+
+async def _read_entries_fast(response, limit: int) -> List[Tuple[str, str]]:
+    """Stream the body into the incremental reader and stop once `limit` entries are in"""
+    reader = FeedEntryReader(limit)
+    body = bytearray()
+
+    try:
+        async for chunk in response.content.iter_chunked(16384):
+            body.extend(chunk)
+            if reader.feed(chunk):
+                # enough entries, drop the rest of the download
+                return reader.entries
+        return reader.close()
+
+    except ET.ParseError:
+        # not well-formed XML (stray entities, HTML...), let feedparser cope
+        body.extend(await response.content.read())
+        return _parse_entries(bytes(body))
+
+
+async def fetch_feed_entries(url: str, headers: Dict[str, str] = None,
+                             limit: int = None) -> Tuple[Optional[List[Tuple[str, str]]], Dict[str, str]]:
+    """Download and parse a feed over the current session (or a one-off one)
+
+    With the fast parser only the first `limit` entries are read, otherwise
+    the whole document goes through feedparser.
+    Returns: (entries, response headers), entries is None on 304 Not Modified
+    """
+    session = _current_session.get()
+    if session is None:
+        async with feed_session(conditional_get=False):
+            return await fetch_feed_entries(url, headers, limit)
+
+    async with session.get(url, headers=headers) as response:
+        if response.status == 304:
+            return None, dict(response.headers)
+        response.raise_for_status()
+
+        if FAST_PARSER and limit:
+            entries = await _read_entries_fast(response, limit)
+        else:
+            entries = _parse_entries(await response.read())
+        return entries, dict(response.headers)
+
+
+async def fetch_rss(url: str, source_name: str, limit: int = 3, ttl: float = None) -> List[Tuple[str, str]]:
+    """Generic async RSS fetcher
+
+    Serves the feed from the run memo, then the result cache (if fetched less
+    than `ttl` seconds ago, default feeds.cache.ttl; skipped altogether when
+    feeds.cache.enabled is false), and only then goes to the network,
+    revalidating against the validator cache if enabled. Every cached
+    copy records how deep it was read, one read too shallow for `limit`
+    counts as a miss.
+    Returns: List of (title, link)
+    """
+    if url in _run_memo:
+        entries, depth = _run_memo[url]
+        if covers(entries, depth, limit):
+            return entries[:limit]
+
+    # a feed's own ttl doesn't switch the cache back on
+    ttl = (DEFAULT_TTL if ttl is None else ttl) if CACHE_ENABLED else 0
+    if ttl:
+        fresh = await asyncio.to_thread(result_cache.get, f'feed:{url}', ttl)
+        # older cache rows are bare lists, without a depth: refetch those
+        if isinstance(fresh, dict):
+            entries = [tuple(entry) for entry in fresh['entries']]
+            if covers(entries, fresh['depth'], limit):
+                _run_memo[url] = (entries, fresh['depth'])
+                return entries[:limit]
+
+    # the fast reader stops after `limit` entries, feedparser reads them all
+    depth = limit if FAST_PARSER else None
+    try:
+        cache = _current_cache.get()
+        cached = cache.entries(url) if cache else None
+        if cached is not None and not covers(*cached, limit):
+            # a 304 would only give back a list that's too short
+            cached = None
+        headers = cache.conditional_headers(url) if cached is not None else None
+
+        fetched, response_headers = await fetch_feed_entries(url, headers, limit)
+
+        if fetched is None:
+            # 304 Not Modified, nothing new since the last digest
+            entries, depth = cached
+        else:
+            entries = fetched
+            if cache:
+                cache.store(url, response_headers.get('ETag'),
+                            response_headers.get('Last-Modified'), entries, depth)
+
+        if ttl and entries:
+            stored, stored_depth = cap_entries(entries, depth)
+            await asyncio.to_thread(result_cache.put, f'feed:{url}',
+                                    {'entries': [list(entry) for entry in stored], 'depth': stored_depth})
+
+    except Exception as e:
+        print(f"Error fetching {source_name} RSS: {e}")
+        # don't retry a broken feed for every subscriber
+        entries, depth = [], None
+
+    _run_memo[url] = (entries, depth)
+    return entries[:limit]
+
+
+def run_feed_tasks(*coroutines, **session_options) -> List[Any]:
+    """Run feed coroutines on one event loop sharing one pooled session
+    Returns: List of results in the same order as the coroutines
+    """
+    async def _run():
+        async with feed_session(**session_options):
+            return await asyncio.gather(*coroutines)
+
+    return list(asyncio.run(_run()))
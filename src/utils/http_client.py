@@ -0,0 +1,69 @@
+import json
+import threading
+import requests
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+#load config with proper path
+config_path = Path(__file__).parent.parent / 'configs' / 'config.json'
+
+try:
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config_data = json.load(f)
+except FileNotFoundError:
+    print(f'config.json not found at {config_path}')
+    config_data = {}
+
+
+class HttpClient:
+    """Shared requests.Session with per-host pooling, keep-alive, retries and a default timeout"""
+
+    def __init__(self, timeout: float = 10, retries: int = 3, backoff_factor: float = 0.5,
+                 pool_connections: int = 10, pool_maxsize: int = 10,
+                 status_forcelist=(429, 500, 502, 503, 504), headers: dict = None):
+        self.timeout = timeout
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+
+        # Retry connection errors and transient statuses with exponential backoff,
+        # but hand the last response back instead of raising so callers can check it
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=status_forcelist,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                              max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET through the pooled session, applying the default timeout"""
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.get(url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HttpClient:
+    """Process-wide client built from the "http" config section"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient(**config_data.get('http', {}))
+    return _client
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """Shortcut for get_client().get(...)"""
+    return get_client().get(url, **kwargs)
@@ -0,0 +1,91 @@
+from pathlib import Path
+from typing import Optional, Tuple
+
+# Pillow format name and file suffix for each supported output format
+FORMATS = {
+    'png': ('PNG', '.png'),
+    'jpeg': ('JPEG', '.jpg'),
+    'jpg': ('JPEG', '.jpg'),
+    'webp': ('WEBP', '.webp'),
+}
+
+
+def crop_image(path: Path, box: Tuple[int, int, int, int]) -> bool:
+    """Crop an image file in place to (left, top, right, bottom)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return False
+
+    try:
+        with Image.open(path) as image:
+            left, top, right, bottom = box
+            # Clamp to the image so a stale viewport can't crop outside it
+            box = (max(0, left), max(0, top), min(image.width, right), min(image.height, bottom))
+            if box[2] <= box[0] or box[3] <= box[1]:
+                return False
+            cropped = image.crop(box)
+            cropped.load()
+        cropped.save(path)
+        return True
+    except Exception as e:
+        print(f"   ⚠️  Crop failed: {e}")
+        return False
+
+
+def optimize_image(path: Path, width: int = 750, fmt: str = 'jpeg', quality: int = 80,
+                   crop: Optional[Tuple[int, int, int, int]] = None) -> Path:
+    """
+    Crop, downsample and re-encode an image for embedding in the email
+
+    Args:
+        path: Image to process
+        width: Maximum width in pixels (the email displays images at 750px)
+        fmt: 'png', 'jpeg' or 'webp'
+        quality: Encoder quality for JPEG / WebP
+        crop: Optional (left, top, right, bottom) box applied first
+
+    Returns:
+        Path of the optimized image, or the original path if it couldn't be processed
+    """
+    path = Path(path)
+    try:
+        from PIL import Image
+    except ImportError:
+        return path
+
+    pil_format, suffix = FORMATS.get(fmt.lower(), FORMATS['jpeg'])
+    output_path = path.with_suffix(suffix)
+
+    try:
+        original_kb = path.stat().st_size / 1024
+        with Image.open(path) as source:
+            # work on a copy so the file can be overwritten in place
+            image = source.copy()
+
+        if crop:
+            image = image.crop(crop)
+        if image.width > width:
+            height = round(image.height * width / image.width)
+            image = image.resize((width, height), Image.LANCZOS)
+
+        if pil_format == 'JPEG':
+            image = image.convert('RGB')
+            save_options = {'quality': quality, 'optimize': True, 'progressive': True}
+        elif pil_format == 'WEBP':
+            save_options = {'quality': quality, 'method': 6}
+        else:
+            save_options = {'optimize': True}
+
+        image.save(output_path, pil_format, **save_options)
+
+        if output_path != path:
+            path.unlink(missing_ok=True)
+
+        size_kb = output_path.stat().st_size / 1024
+        print(f"   ✓ Optimized {output_path.name}: {original_kb:.1f} KB -> {size_kb:.1f} KB")
+        return output_path
+
+    except Exception as e:
+        print(f"   ⚠️  Image optimization failed: {e}")
+        return path
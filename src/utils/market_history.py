@@ -0,0 +1,146 @@
+import json
+import sqlite3
+import time
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.result_cache import SqliteStore, cache_dir
+
+
+def _price(value: Any, currency: str = None) -> Optional[float]:
+    """Price out of a snapshot entry: either a number or a {'price': ...} dict,
+    or with a `currency`, the entry's {'prices': {currency: ...}}
+    """
+    if isinstance(value, dict):
+        value = value.get('prices', {}).get(currency) if currency else value.get('price')
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+class MarketHistory(SqliteStore):
+    """Append-only store of money snapshots (crypto, rates, metals, indices)
+
+    One row per provider per run, the whole snapshot packed as JSON, so a
+    year of daily runs is a few thousand rows. Rows older than
+    `retention_days` are dropped on write.
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS snapshots (
+            provider TEXT NOT NULL,
+            taken_at REAL NOT NULL,
+            data TEXT NOT NULL
+        )
+        """,
+        'CREATE INDEX IF NOT EXISTS snapshots_time ON snapshots (provider, taken_at)',
+    )
+
+    def __init__(self, path: Path = cache_dir / 'market.sqlite3', retention_days: float = 90):
+        super().__init__(path)
+        self.retention = retention_days * 86400
+
+    def record(self, provider: str, data: Dict):
+        """Append a snapshot and drop the ones past the retention window"""
+        now = time.time()
+        try:
+            with closing(self._connect()) as connection:
+                connection.execute(
+                    'INSERT INTO snapshots (provider, taken_at, data) VALUES (?, ?, ?)',
+                    (provider, now, json.dumps(data, ensure_ascii=False))
+                )
+                connection.execute('DELETE FROM snapshots WHERE taken_at < ?', (now - self.retention,))
+                connection.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"Error writing market history: {e}")
+
+    def _query(self, sql: str, params: tuple) -> List[tuple]:
+        try:
+            with closing(self._connect()) as connection:
+                return connection.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            print(f"Error reading market history: {e}")
+            return []
+
+    def last(self, provider: str, max_age_days: float = None) -> Optional[Tuple[Dict, float]]:
+        """Most recent snapshot of a provider and when it was taken,
+        None if there is none (or none younger than `max_age_days`)
+        """
+        since = time.time() - max_age_days * 86400 if max_age_days is not None else 0
+        rows = self._query(
+            'SELECT data, taken_at FROM snapshots WHERE provider = ? AND taken_at >= ? '
+            'ORDER BY taken_at DESC LIMIT 1',
+            (provider, since)
+        )
+        return (json.loads(rows[0][0]), rows[0][1]) if rows else None
+
+    def at(self, provider: str, days_ago: float) -> Optional[Dict]:
+        """Latest snapshot taken at least `days_ago` days ago"""
+        rows = self._query(
+            'SELECT data FROM snapshots WHERE provider = ? AND taken_at <= ? ORDER BY taken_at DESC LIMIT 1',
+            (provider, time.time() - days_ago * 86400)
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    def daily_series(self, provider: str, days: int = 7, currency: str = None) -> Dict[str, List[float]]:
+        """Closing price per day over the last `days` days, oldest first
+        (in `currency` for entries priced in several, see _price)
+        Returns: Dict of {name: List of prices}
+        """
+        rows = self._query(
+            'SELECT taken_at, data FROM snapshots WHERE provider = ? AND taken_at >= ? ORDER BY taken_at',
+            (provider, time.time() - days * 86400)
+        )
+
+        # the last snapshot of each day wins
+        by_day: Dict[str, Dict] = {}
+        for taken_at, data in rows:
+            by_day[datetime.fromtimestamp(taken_at).date().isoformat()] = json.loads(data)
+
+        series: Dict[str, List[float]] = {}
+        for snapshot in by_day.values():
+            for name, value in snapshot.items():
+                price = _price(value, currency)
+                if price is not None:
+                    series.setdefault(name, []).append(price)
+        return series
+
+    def enrich(self, provider: str, data: Dict, days: int = 7, currency: str = None) -> Dict:
+        """Add 'change_7d' (percent) and 'trend' (daily prices) to dict entries
+        Only entries with enough history get them, the rest are returned as is
+        With a `currency`, both are computed from the entries' 'prices' in it
+        """
+        past = self.at(provider, days) or {}
+        series = self.daily_series(provider, days, currency)
+
+        enriched = {}
+        for name, value in data.items():
+            if isinstance(value, dict):
+                value = dict(value)
+                current, before = _price(value, currency), _price(past.get(name), currency)
+                if current is not None and before:
+                    value['change_7d'] = round((current - before) / before * 100, 2)
+                if len(series.get(name, [])) > 1:
+                    value['trend'] = series[name]
+            enriched[name] = value
+        return enriched
+
+    def enrich_by_currency(self, provider: str, data: Dict, days: int = 7) -> Dict:
+        """enrich() for entries priced in several currencies ('prices'), once per
+        currency, so a change is never taken between two different currencies
+        Adds 'changes_7d' and 'trends', both {currency: value}
+        """
+        currencies = sorted({currency for value in data.values() if isinstance(value, dict)
+                             for currency in value.get('prices', {})})
+        enriched = {name: dict(value) if isinstance(value, dict) else value for name, value in data.items()}
+
+        for currency in currencies:
+            for name, value in self.enrich(provider, data, days, currency).items():
+                if not isinstance(value, dict):
+                    continue
+                if 'change_7d' in value:
+                    enriched[name].setdefault('changes_7d', {})[currency] = value['change_7d']
+                if 'trend' in value:
+                    enriched[name].setdefault('trends', {})[currency] = value['trend']
+        return enriched
@@ -0,0 +1,92 @@
+from typing import Dict, List
+
+# Config sections a subscriber profile can override
+PROFILE_SECTIONS = ('web_scrapper', 'rss_feeds', 'money', 'entertainment', 'weather')
+
+
+def _as_list(value) -> List:
+    if value is None:
+        return []
+    return [value] if isinstance(value, str) else list(value)
+
+
+def _merge_value(current, value):
+    """Union of two settings: flags are OR-ed, lists are merged in order,
+    mappings are merged key by key (the first value wins on a clash)
+    """
+    if current is None:
+        if isinstance(value, dict):
+            return _merge_value({}, value)
+        return list(value) if isinstance(value, list) else value
+    if isinstance(value, bool) or isinstance(current, bool):
+        return bool(current) or bool(value)
+    if isinstance(current, list) and isinstance(value, list):
+        return current + [item for item in value if item not in current]
+    if isinstance(current, dict) and isinstance(value, dict):
+        merged = dict(current)
+        for key, item in value.items():
+            merged[key] = _merge_value(merged.get(key), item)
+        return merged
+    return current
+
+
+def profile_config(base_config: Dict, profile: Dict) -> Dict:
+    """Effective config for one subscriber
+
+    A section given in the profile replaces the global one, so a subscriber
+    lists exactly the sources they want; missing sections inherit the global config.
+    """
+    merged = dict(base_config)
+    for section in PROFILE_SECTIONS:
+        if section in profile:
+            merged[section] = profile[section]
+    return merged
+
+
+def load_profiles(config: Dict, default_recipients: List[str]) -> List[Dict]:
+    """Subscriber profiles from config["subscribers"]
+    Falls back to the global config for every default recipient (RECIPIENT_EMAIL)
+    Returns: List of {'email': str, 'config': Dict}
+    """
+    subscribers = config.get('subscribers') or []
+    if not subscribers:
+        return [{'email': email, 'config': config} for email in default_recipients]
+
+    return [
+        {'email': subscriber['email'], 'config': profile_config(config, subscriber)}
+        for subscriber in subscribers
+        if subscriber.get('email')
+    ]
+
+
+def union_config(configs: List[Dict]) -> Dict:
+    """Single config enabling every source any of the configs needs
+
+    Boolean source flags are OR-ed together, lists (and weather cities) are
+    merged, so the collector fetches each distinct source exactly once.
+    """
+    if not configs:
+        return {}
+
+    union = dict(configs[0])
+
+    for section in PROFILE_SECTIONS:
+        if section == 'weather':
+            continue
+        merged = {}
+        for config in configs:
+            for key, value in config.get(section, {}).items():
+                merged[key] = _merge_value(merged.get(key), value)
+        union[section] = merged
+
+    weather = dict(configs[0].get('weather', {}))
+    cities = []
+    for config in configs:
+        for city in _as_list(config.get('weather', {}).get('city')):
+            if city not in cities:
+                cities.append(city)
+    if cities:
+        weather['city'] = cities
+    union['weather'] = weather
+
+    return union
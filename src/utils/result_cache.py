@@ -0,0 +1,96 @@
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+cache_dir = Path(__file__).parent.parent / 'cache'
+
+
+class SqliteStore:
+    """Base for the small SQLite files under src/cache
+
+    Subclasses list their CREATE statements in SCHEMA. The folder and the
+    schema are created on first use, with one short-lived connection per
+    call so a store is safe to share across threads.
+    """
+    SCHEMA: Tuple[str, ...] = ()
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._ready:
+            # sqlite can't create the folder itself (fresh checkout: no src/cache yet)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=10)
+        if not self._ready:
+            connection.execute('PRAGMA journal_mode=WAL')
+            for statement in self.SCHEMA:
+                connection.execute(statement)
+            connection.commit()
+            self._ready = True
+        return connection
+
+
+class ResultCache(SqliteStore):
+    """SQLite key/value cache with per-entry TTL and LRU eviction
+
+    Values are stored as JSON. The database is a plain file, so every process
+    (main run, per-module __main__ tests, ...) shares the same cache.
+    """
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS results (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            stored_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )
+        """,
+        'CREATE INDEX IF NOT EXISTS results_lru ON results (accessed_at)',
+    )
+
+    def __init__(self, path: Path = cache_dir / 'results.sqlite3', max_entries: int = 500):
+        super().__init__(path)
+        self.max_entries = max_entries
+
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """Cached value if stored less than `ttl` seconds ago, else None"""
+        if not ttl or ttl <= 0:
+            return None
+        try:
+            now = time.time()
+            with closing(self._connect()) as connection:
+                row = connection.execute(
+                    'SELECT value FROM results WHERE key = ? AND stored_at >= ?',
+                    (key, now - ttl)
+                ).fetchone()
+                if row is None:
+                    return None
+                connection.execute('UPDATE results SET accessed_at = ? WHERE key = ?', (now, key))
+                connection.commit()
+                return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Error reading result cache: {e}")
+            return None
+
+    def put(self, key: str, value: Any):
+        """Store a value and evict the least recently used entries over the limit"""
+        try:
+            now = time.time()
+            with closing(self._connect()) as connection:
+                connection.execute(
+                    'INSERT OR REPLACE INTO results (key, value, stored_at, accessed_at) VALUES (?, ?, ?, ?)',
+                    (key, json.dumps(value, ensure_ascii=False), now, now)
+                )
+                connection.execute("""
+                    DELETE FROM results WHERE key IN (
+                        SELECT key FROM results ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                    )
+                """, (self.max_entries,))
+                connection.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"Error writing result cache: {e}")
@@ -1,34 +1,191 @@
-import requests
-from bs4 import BeautifulSoup
-from typing import Dict
+import json
+from pathlib import Path
+from src.utils import http_client
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
 
-def _safe_scrape(url: str, tag: str, attrs: Dict) -> tuple:
-    """Helper to safely scrape with error handling"""
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        element = soup.find(tag, attrs)
-        if element:
-            # get link
-            title = element.text.strip()
-
-            # if element is <a>, get href
-            if tag == 'a':
-                link = element.get('href', url)
-            else:
+# lxml's C parser is several times faster than the pure-Python html.parser
+try:
+    from lxml import etree
+    PARSER = "lxml"
+except ImportError:
+    etree = None
+    PARSER = "html.parser"
+
+#load config with proper path
+config_path = Path(__file__).parent.parent / 'configs' / 'config.json'
+
+try:
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config_data = json.load(f)
+except FileNotFoundError:
+    print(f'config.json not found at {config_path}')
+    config_data = {}
+
+scrape_config = config_data.get('scrape', {})
+STREAM = scrape_config.get('stream', True)
+CHUNK_SIZE = scrape_config.get('chunk_size', 16384)
+
+
+def _attrs_match(actual: Dict[str, Optional[str]], wanted: Dict) -> bool:
+    """Same rule as BeautifulSoup: a class matches the whole attribute or any single class"""
+    for name, value in wanted.items():
+        present = actual.get(name)
+        if present is None:
+            return False
+        if name == 'class':
+            if present != value and value not in present.split():
+                return False
+        elif present != value:
+            return False
+    return True
+
+
+class HeadlineStreamParser:
+    """Incremental lxml parser that stops at the first `tag` matching `attrs`
+
+    Bytes are fed as they arrive. The link wrapping the headline is read off
+    the partial tree, and elements that have closed outside the headline are
+    cleared as they go. `done` turns True once the element has closed.
+    """
+
+    def __init__(self, tag: str, attrs: Dict, encoding: str = None):
+        self.tag = tag
+        self.attrs = attrs
+        self.done = False
+        self.title: Optional[str] = None
+        self.link: Optional[str] = None
+        self._parser = etree.HTMLPullParser(events=('start', 'end'), encoding=encoding)
+        self._element = None
+        self._outer_link: Optional[str] = None
+
+    def feed(self, data: bytes) -> bool:
+        """Parse another chunk, True once the headline is complete"""
+        if not self.done:
+            self._parser.feed(data)
+            self._process_events()
+        return self.done
+
+    def close(self) -> bool:
+        """Finish a fully downloaded document, True if the headline was in it"""
+        if not self.done:
+            try:
+                self._parser.close()
+            except etree.LxmlError:
+                # empty or hopeless document, nothing more to read
+                return False
+            self._process_events()
+        return self.done
+
+    def _process_events(self):
+        for event, element in self._parser.read_events():
+            if not isinstance(element.tag, str):
+                # comments and processing instructions
+                continue
+
+            if event == 'start':
+                if self._element is None and element.tag == self.tag \
+                        and _attrs_match(dict(element.attrib), self.attrs):
+                    self._element = element
+                    self._outer_link = next((a.get('href') for a in element.iterancestors('a')
+                                             if a.get('href')), None)
+                continue
 
-                a_tag = element.find('a') or element.find_parent('a')
-                link = a_tag.get('href', url) if a_tag else url
+            if element is self._element:
+                self.title = ''.join(element.itertext()).strip()
+                if self.tag == 'a':
+                    self.link = element.get('href')
+                else:
+                    inner = next((a.get('href') for a in element.iter('a') if a.get('href')), None)
+                    self.link = inner or self._outer_link
+                self.done = True
+                return
+            if self._element is None:
+                # keep the tree small: only the open ancestors are still needed
+                element.clear(keep_tail=True)
 
-            if link.startswith('/'):
-                from urllib.parse import urljoin
-                link = urljoin(url, link)
 
-            return title, link
+def _find_headline(html: str, url: str, tag: str, attrs: Dict) -> tuple:
+    """Locate the headline element and its link in a page
+    Returns: (title, link) or None if the element isn't there
+    """
+    # Only `tag` and <a> elements (with what's inside them) are built into the
+    # tree, so a link wrapping the headline is kept as its parent. The strainer
+    # filters on names alone: at parse time it can't match one class out of
+    # several, find() then applies the attrs with the usual rules
+    soup = BeautifulSoup(html, PARSER, parse_only=SoupStrainer([tag, 'a']))
+    element = soup.find(tag, attrs)
+    if element is None:
+        return None
+
+    if tag == 'a':
+        link = element.get('href', url)
+    else:
+        a_tag = element.find('a') or element.find_parent('a')
+        link = a_tag.get('href', url) if a_tag else url
+
+    if link.startswith('/'):
+        link = urljoin(url, link)
+
+    return element.text.strip(), link
+
+
+def _stream_encoding(response, first_chunk: bytes) -> Optional[str]:
+    """Charset to decode a streamed page with: the server's, else None to let
+    lxml follow the page's <meta> tag, else UTF-8 (libxml2 would assume Latin-1)
+    """
+    if 'charset' in response.headers.get('Content-Type', '').lower():
+        return response.encoding
+    if b'charset' in first_chunk.lower():
+        return None
+    return 'utf-8'
+
+
+def _stream_headline(response, url: str, tag: str, attrs: Dict) -> tuple:
+    """Feed the body chunk by chunk and stop reading once the headline is complete
+    A page that ends without it is not parsed again
+    Returns: (title, link) or None
+    """
+    parser = None
+    found = False
+    for chunk in response.iter_content(CHUNK_SIZE):
+        if parser is None:
+            parser = HeadlineStreamParser(tag, attrs, encoding=_stream_encoding(response, chunk))
+        if parser.feed(chunk):
+            found = True
+            break
+    if parser is None or not (found or parser.close()):
+        return None
+
+    link = parser.link or url
+    return parser.title, urljoin(url, link) if link.startswith('/') else link
+
+
+def _safe_scrape(url: str, tag: str, attrs: Dict, stream: bool = None) -> tuple:
+    """Helper to safely scrape with error handling
+
+    In stream mode (config scrape.stream) the connection is closed as soon as
+    the headline has been read, instead of downloading the whole page.
+    """
+    # streaming needs lxml's incremental parser
+    stream = (STREAM if stream is None else stream) and etree is not None
+    try:
+        response = http_client.get(url, stream=stream)
+        try:
+            response.raise_for_status()
+
+            if stream:
+                found = _stream_headline(response, url, tag, attrs)
+            else:
+                found = _find_headline(response.text, url, tag, attrs)
+        finally:
+            response.close()
+
+        if found:
+            return found
         else:
             return f"[Element not found]", url
 
     except Exception as e:
-        return f"[Error: {str(e)}]", url
\ No newline at end of file
+        return f"[Error: {str(e)}]", url
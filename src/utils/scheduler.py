@@ -0,0 +1,98 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict
+
+
+def _worker(work: queue.SimpleQueue, started: Dict[str, float]):
+    """Pull jobs off the queue until the None sentinel"""
+    while True:
+        item = work.get()
+        if item is None:
+            return
+        future, name, func = item
+        # skipped if the job was cancelled while still queued
+        if not future.set_running_or_notify_cancel():
+            continue
+        started[name] = time.monotonic()
+        try:
+            future.set_result(func())
+        except BaseException as e:
+            future.set_exception(e)
+
+
+def run_concurrently(jobs: Dict[str, Callable[[], Any]], max_workers: int = 4,
+                     timeout: float = 60, timeouts: Dict[str, float] = None,
+                     defaults: Dict[str, Any] = None, deadline: float = None) -> Dict[str, Any]:
+    """Run named jobs on a bounded thread pool and collect their results
+
+    Each job's timeout starts when a worker picks it up, so queued jobs are
+    not penalised by a small pool. On top of that the whole call ends after
+    `deadline` seconds (default: the longest job timeout), so jobs still
+    queued behind hung ones can't wait forever. A job that raises, runs past
+    its timeout or never got a worker gets its entry from `defaults` (None if
+    missing) instead of failing the run.
+
+    Workers are daemon threads: a job that is abandoned (e.g. a stuck browser)
+    keeps running in the background but doesn't keep the process alive at
+    exit, unlike ThreadPoolExecutor whose threads are joined then.
+
+    Returns: Dict of {job_name: result}
+    """
+    timeouts = timeouts or {}
+    defaults = defaults or {}
+    if deadline is None:
+        deadline = max([timeout, *timeouts.values()])
+    started: Dict[str, float] = {}
+    results: Dict[str, Any] = {}
+
+    work: queue.SimpleQueue = queue.SimpleQueue()
+    futures = {}
+    for name, func in jobs.items():
+        future = Future()
+        futures[future] = name
+        work.put((future, name, func))
+
+    workers = max(1, min(max_workers, len(jobs)))
+    for _ in range(workers):
+        threading.Thread(target=_worker, args=(work, started), daemon=True).start()
+
+    run_started = time.monotonic()
+    pending = set(futures)
+
+    try:
+        while pending:
+            done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    print(f"   ✗ {name} failed: {e}")
+                    results[name] = defaults.get(name)
+
+            now = time.monotonic()
+            for future in list(pending):
+                name = futures[future]
+                limit = timeouts.get(name, timeout)
+                if name in started and now - started[name] > limit:
+                    # the worker thread can't be killed, we just stop waiting for it
+                    print(f"   ✗ {name} timed out after {limit:.0f}s")
+                elif now - run_started > deadline:
+                    print(f"   ✗ {name} {'timed out' if name in started else 'never started'}"
+                          f" within the {deadline:.0f}s deadline")
+                else:
+                    continue
+                future.cancel()
+                results[name] = defaults.get(name)
+                pending.discard(future)
+    finally:
+        # drop what's still queued and let the idle workers exit
+        for future in futures:
+            future.cancel()
+        for _ in range(workers):
+            work.put(None)
+
+    return results
@@ -0,0 +1,86 @@
+import hashlib
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Set, Tuple
+
+from src.utils.dedup import normalize_url
+from src.utils.result_cache import SqliteStore, cache_dir
+
+
+def story_key(link: str, title: str) -> str:
+    """Compact fingerprint of a story: its canonical URL, or its title when there is no link"""
+    basis = normalize_url(link) if link else ' '.join(title.lower().split())
+    return hashlib.blake2b(basis.encode('utf-8'), digest_size=8).hexdigest()
+
+
+class StoryHistory(SqliteStore):
+    """Stories already sent, per subscriber, so a digest only shows new items
+
+    Each scope's keys are loaded into a set once per run, so every lookup is
+    O(1). Rows older than `retention_days` are dropped and each scope keeps
+    at most `max_rows`, so the file stays bounded however long it runs.
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS sent (
+            scope TEXT NOT NULL,
+            key TEXT NOT NULL,
+            sent_at REAL NOT NULL,
+            PRIMARY KEY (scope, key)
+        ) WITHOUT ROWID
+        """,
+        'CREATE INDEX IF NOT EXISTS sent_age ON sent (scope, sent_at)',
+    )
+
+    def __init__(self, path: Path = cache_dir / 'history.sqlite3',
+                 retention_days: float = 30, max_rows: int = 20000):
+        super().__init__(path)
+        self.retention = retention_days * 86400
+        self.max_rows = max_rows
+        self._seen: Dict[str, Set[str]] = {}
+
+    def seen(self, scope: str) -> Set[str]:
+        """Keys sent to `scope` within the retention window"""
+        if scope not in self._seen:
+            try:
+                with closing(self._connect()) as connection:
+                    rows = connection.execute(
+                        'SELECT key FROM sent WHERE scope = ? AND sent_at >= ?',
+                        (scope, time.time() - self.retention)
+                    ).fetchall()
+                self._seen[scope] = {row[0] for row in rows}
+            except sqlite3.Error as e:
+                print(f"Error reading story history: {e}")
+                self._seen[scope] = set()
+        return self._seen[scope]
+
+    def new_story_filter(self, scope: str) -> Callable[[str, str, str], bool]:
+        """Predicate over (source, title, link) that is True for stories not sent to `scope` yet"""
+        seen = self.seen(scope)
+        return lambda source, title, link: story_key(link, title) not in seen
+
+    def mark_sent(self, scope: str, items: Iterable[Tuple[str, str, str]]):
+        """Record (source, title, link) items as delivered and prune old rows"""
+        now = time.time()
+        keys = {story_key(link, title) for _, title, link in items}
+        if not keys:
+            return
+        try:
+            with closing(self._connect()) as connection:
+                connection.executemany(
+                    'INSERT OR REPLACE INTO sent (scope, key, sent_at) VALUES (?, ?, ?)',
+                    [(scope, key, now) for key in keys]
+                )
+                connection.execute('DELETE FROM sent WHERE sent_at < ?', (now - self.retention,))
+                connection.execute("""
+                    DELETE FROM sent WHERE scope = ? AND key IN (
+                        SELECT key FROM sent WHERE scope = ? ORDER BY sent_at DESC LIMIT -1 OFFSET ?
+                    )
+                """, (scope, scope, self.max_rows))
+                connection.commit()
+            self.seen(scope).update(keys)
+        except sqlite3.Error as e:
+            print(f"Error writing story history: {e}")